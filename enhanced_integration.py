@@ -5,13 +5,29 @@ Upgrades existing poker bot with new table reference and OCR systems
 
 import os
 import sys
+import json
+import time
+import hashlib
+import tempfile
 import cv2
 import numpy as np
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Optional, Dict, Any, List, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Constants
 ENHANCED_REGIONS_CONFIG = 'enhanced_regions_config.json'
+DEBUG_RING_SIZE = 64          # Region crops kept in memory while debugging
+DEBUG_FLUSH_INTERVAL = 30     # Write debug crops to disk every N debug frames
+FAST_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
 
 # Add current directory to path
 sys.path.append(os.path.dirname(__file__))
@@ -24,6 +40,56 @@ from enhanced_ocr_recognition import EnhancedOCRCardRecognition
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# OpenCV runtime: SIMD kernels on, a small fixed thread pool, and no OpenCL
+# (kernel launch latency outweighs the gain on small per-frame images)
+cv2.setUseOptimized(True)
+cv2.setNumThreads(min(4, os.cpu_count() or 1))
+cv2.ocl.setUseOpenCL(False)
+logger.debug(f"OpenCV optimized={cv2.useOptimized()}, threads={cv2.getNumThreads()}, "
+             f"OpenCL={cv2.ocl.useOpenCL()}")
+
+class RegionKind(IntEnum):
+    """Region types, resolved once from region names"""
+    HERO_CARD = 0
+    COMMUNITY_CARD = 1
+    POT = 2
+    OTHER = 3
+
+# Visualization colors indexed by RegionKind
+REGION_COLORS = (
+    (0, 255, 0),    # Green for hero cards
+    (255, 0, 0),    # Red for community cards
+    (0, 0, 255),    # Blue for pot
+    (255, 255, 0),  # Yellow for other
+)
+INVALID_REGION_COLOR = (255, 0, 255)  # Magenta for out-of-bounds regions
+
+def classify_region(region_name: str) -> RegionKind:
+    """Determine the region type from its name"""
+    if 'card' in region_name:
+        return RegionKind.HERO_CARD if 'hero' in region_name else RegionKind.COMMUNITY_CARD
+    if 'pot' in region_name:
+        return RegionKind.POT
+    return RegionKind.OTHER
+
+def compute_region_rects(x_pct: np.ndarray, y_pct: np.ndarray, w_pct: np.ndarray, h_pct: np.ndarray,
+                         width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert region percentages to pixel rectangles for a frame size
+    
+    Returns:
+        (N, 4) int32 array of x, y, w, h and an (N,) bool mask of regions inside the frame
+    """
+    rects = np.empty((len(x_pct), 4), dtype=np.int32)
+    rects[:, 0] = x_pct * width
+    rects[:, 1] = y_pct * height
+    rects[:, 2] = w_pct * width
+    rects[:, 3] = h_pct * height
+    
+    x, y, w, h = rects.T
+    valid = (x >= 0) & (x < width) & (y >= 0) & (y < height) & (x + w <= width) & (y + h <= height)
+    return rects, valid
+
 class EnhancedPokerBot:
     """Enhanced poker bot with auto-calibration and advanced OCR"""
     
@@ -40,6 +106,37 @@ class EnhancedPokerBot:
         self.auto_calibrated = False
         self.last_screenshot = None
         
+        # Region kinds by name, percentages as parallel arrays and absolute coordinates
+        # per (width, height), all rebuilt whenever regions change
+        self._region_kind = {}
+        self._regions_soa = None
+        self._coord_cache = {}
+        self._invalid_coord_cache = {}
+        self._validated_size = None
+        
+        # Debug crops are buffered in memory and flushed periodically instead of every frame
+        self._debug_ring = deque(maxlen=DEBUG_RING_SIZE)
+        self._debug_frame_counter = 0
+        self._debug_names = {}
+        
+        # Visualization frame reused between create_visualization calls
+        self._vis_buf = None
+        
+        # Recent window capture reused for calls within capture_ttl_ms
+        self.capture_ttl_ms = 30
+        self._cap_cache = (None, 0.0)
+        
+        # Two frame buffers filled alternately by the capture layer, so the previous
+        # frame stays intact while the next one is captured
+        self._frame_bufs = [None, None]
+        self._frame_idx = 0
+        
+        # Thumbnail hash of the last saved calibration screenshot
+        self._last_calib_hash = None
+        
+        # Config saves run in the background so recalibration never blocks on disk
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='regions-config')
+        
         # Import window capture if available
         try:
             if original_bot and hasattr(original_bot, 'window_capture'):
@@ -58,27 +155,29 @@ class EnhancedPokerBot:
         """Auto-calibrate the bot using table reference system"""
         try:
             # Capture screenshot if not provided
+            screenshot = self._capture_or_none(screenshot)
             if screenshot is None:
-                if self.window_capture:
-                    screenshot = self.window_capture.capture_window()
-                else:
-                    logger.error("No screenshot provided and no window capture available")
-                    return False
-            
-            if screenshot is None:
-                logger.error("Failed to capture screenshot for calibration")
                 return False
             
-            # Save the screenshot for reference
-            cv2.imwrite('calibration_screenshot.png', screenshot)
-            logger.info("Saved calibration screenshot as 'calibration_screenshot.png'")
+            # Save the screenshot for reference, unless it matches the one already saved
+            calib_hash = hash(cv2.resize(screenshot, (32, 32), interpolation=cv2.INTER_AREA).tobytes())
+            if calib_hash != self._last_calib_hash or not os.path.exists('calibration_screenshot.png'):
+                cv2.imwrite('calibration_screenshot.png', screenshot, FAST_PNG_PARAMS)
+                self._last_calib_hash = calib_hash
+                logger.info("Saved calibration screenshot as 'calibration_screenshot.png'")
             
             # Auto-calibrate using table reference system
             logger.info("Starting auto-calibration...")
             self.regions = self.table_ref.auto_calibrate_from_screenshot(screenshot)
+            self._on_regions_changed()
             
             if self.regions:
                 self.auto_calibrated = True
+                
+                # Validate regions against this frame size now rather than on the first analysis
+                height, width = screenshot.shape[:2]
+                self._get_region_coords(width, height)
+                
                 logger.info(f"Auto-calibration successful! Detected {len(self.regions)} regions:")
                 for name, region in self.regions.items():
                     logger.info(f"  {name}: x={region['x_percent']:.3f}, y={region['y_percent']:.3f}")
@@ -98,7 +197,7 @@ class EnhancedPokerBot:
         """Enhanced game state analysis with auto-calibration and advanced OCR"""
         try:
             # Get screenshot
-            screenshot = self._get_screenshot(screenshot)
+            screenshot = self._capture_or_none(screenshot)
             if screenshot is None:
                 return None
             
@@ -115,11 +214,18 @@ class EnhancedPokerBot:
             logger.error(f"Enhanced game state analysis error: {e}")
             return None
     
-    def _get_screenshot(self, screenshot: Optional[np.ndarray]) -> Optional[np.ndarray]:
-        """Get screenshot from parameter or capture from window"""
+    def _capture_or_none(self, screenshot: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Get screenshot from parameter or capture from window, logging why if none is available"""
         if screenshot is None:
             if self.window_capture:
-                screenshot = self.window_capture.capture_window()
+                cached_img, cached_at = self._cap_cache
+                now = time.monotonic()
+                if cached_img is not None and now - cached_at < self.capture_ttl_ms / 1000:
+                    return cached_img
+                
+                screenshot = self._capture_frame()
+                if screenshot is not None:
+                    self._cap_cache = (screenshot, now)
             else:
                 logger.error("No screenshot provided and no window capture available")
                 return None
@@ -130,6 +236,21 @@ class EnhancedPokerBot:
         
         return screenshot
     
+    def _capture_frame(self) -> Optional[np.ndarray]:
+        """Capture the window, into a reused frame buffer when the capture layer supports it"""
+        if not hasattr(self.window_capture, 'capture_window_into'):
+            return self.window_capture.capture_window()
+        
+        self._frame_idx ^= 1
+        frame = self.window_capture.capture_window_into(self._frame_bufs[self._frame_idx])
+        if frame is not None:
+            self._frame_bufs[self._frame_idx] = frame
+        return frame
+    
+    def invalidate_capture(self) -> None:
+        """Force the next analysis to take a fresh window capture"""
+        self._cap_cache = (None, 0.0)
+    
     def _ensure_calibration(self, screenshot: np.ndarray) -> bool:
         """Ensure regions are calibrated, auto-calibrate if needed"""
         if not self.regions:
@@ -141,20 +262,34 @@ class EnhancedPokerBot:
     
     def _analyze_regions(self, screenshot: np.ndarray, debug: bool) -> Dict[str, Any]:
         """Analyze all regions and build game state"""
-        hero_cards = []
-        community_cards = []
         other_info = {}
         
         height, width = screenshot.shape[:2]
         
-        # Process each region
-        for region_name, region_data in self.regions.items():
-            region_result = self._process_single_region(
-                region_name, region_data, screenshot, width, height, debug
-            )
+        # Make sure crops are row-contiguous views so OpenCV/OCR never copy them internally
+        screenshot = np.ascontiguousarray(screenshot)
+        
+        # First pass: extract each region and group card images by type
+        hero_imgs = []
+        community_imgs = []
+        for region_name, kind, x, y, w, h in self._get_region_coords(width, height):
+            region_img = self._process_single_region(region_name, screenshot, x, y, w, h, debug)
             
-            if region_result:
-                self._add_result_to_state(region_result, hero_cards, community_cards, other_info)
+            if kind == RegionKind.HERO_CARD:
+                hero_imgs.append(region_img)
+            elif kind == RegionKind.COMMUNITY_CARD:
+                community_imgs.append(region_img)
+            elif kind == RegionKind.POT:
+                other_info.update(self._recognize_pot_info(self.regions[region_name]))
+        
+        # Second pass: recognize each card group with a single batch call
+        hero_cards = self._recognize_cards(hero_imgs, RegionKind.HERO_CARD, debug)
+        community_cards = self._recognize_cards(community_imgs, RegionKind.COMMUNITY_CARD, debug)
+        
+        if debug:
+            if self._debug_frame_counter % DEBUG_FLUSH_INTERVAL == 0:
+                self.flush_debug_images()
+            self._debug_frame_counter += 1
         
         # Build comprehensive result
         return {
@@ -167,65 +302,93 @@ class EnhancedPokerBot:
             'other_info': other_info
         }
     
-    def _process_single_region(self, region_name: str, region_data: Dict, screenshot: np.ndarray, 
-                             width: int, height: int, debug: bool) -> Optional[Dict]:
-        """Process a single region and return results"""
-        try:
-            # Calculate absolute coordinates
-            x = int(region_data['x_percent'] * width)
-            y = int(region_data['y_percent'] * height)
-            w = int(region_data['width_percent'] * width)
-            h = int(region_data['height_percent'] * height)
-            
-            # Ensure coordinates are within bounds
-            if not (0 <= x < width and 0 <= y < height and x+w <= width and y+h <= height):
-                logger.warning(f"Region {region_name} coordinates out of bounds")
-                return None
-            
-            # Extract region image
-            region_img = screenshot[y:y+h, x:x+w]
+    def _on_regions_changed(self) -> None:
+        """Classify regions and drop cached region tables after regions change"""
+        self._region_kind = {name: classify_region(name) for name in self.regions}
+        self._debug_names = {name: f"debug_region_{name}.png" for name in self.regions}
+        self._regions_soa = None
+        self._coord_cache.clear()
+        self._invalid_coord_cache.clear()
+        self._validated_size = None
+    
+    def _get_regions_soa(self) -> Dict[str, Any]:
+        """Get region names and percentages as parallel arrays"""
+        if self._regions_soa is None:
+            regions = list(self.regions.values())
+            self._regions_soa = {
+                'names': list(self.regions.keys()),
+                'kinds': [self._region_kind[name] for name in self.regions],
+                'x': np.array([r['x_percent'] for r in regions], dtype=np.float64),
+                'y': np.array([r['y_percent'] for r in regions], dtype=np.float64),
+                'w': np.array([r['width_percent'] for r in regions], dtype=np.float64),
+                'h': np.array([r['height_percent'] for r in regions], dtype=np.float64),
+            }
+        return self._regions_soa
+    
+    def _get_region_coords(self, width: int, height: int) -> List[Tuple[str, RegionKind, int, int, int, int]]:
+        """
+        Get (name, kind, x, y, w, h) pixel coordinates for all in-bounds regions.
+        Computed and bounds-checked once per frame size.
+        """
+        coords = self._coord_cache.get((width, height))
+        if coords is None:
+            if self._validated_size is not None and self._validated_size != (width, height):
+                logger.info(f"Frame size changed to {width}x{height}, re-validating regions")
             
-            if debug:
-                # Save region image for debugging
-                debug_filename = f"debug_region_{region_name}.png"
-                cv2.imwrite(debug_filename, region_img)
+            soa = self._get_regions_soa()
+            rects, valid = compute_region_rects(soa['x'], soa['y'], soa['w'], soa['h'], width, height)
             
-            # Process based on region type
-            return self._recognize_region_content(region_name, region_data, region_img, debug)
+            coords = []
+            invalid = []
+            for name, kind, rect, ok in zip(soa['names'], soa['kinds'], rects.tolist(), valid.tolist()):
+                if ok:
+                    coords.append((name, kind, *rect))
+                else:
+                    invalid.append((name, kind, *rect))
+                    logger.warning(f"Region {name} coordinates out of bounds")
             
-        except Exception as e:
-            logger.error(f"Error processing region {region_name}: {e}")
-            return None
+            self._coord_cache[(width, height)] = coords
+            self._invalid_coord_cache[(width, height)] = invalid
+            self._validated_size = (width, height)
+        return coords
     
-    def _recognize_region_content(self, region_name: str, region_data: Dict, 
-                                region_img: np.ndarray, debug: bool) -> Optional[Dict]:
-        """Recognize content of a region based on its type"""
-        if 'hero' in region_name and 'card' in region_name:
-            return self._recognize_hero_card(region_img, debug)
-        elif 'card' in region_name and 'hero' not in region_name:
-            return self._recognize_community_card(region_img, debug)
-        elif 'pot' in region_name:
-            return self._recognize_pot_info(region_data)
-        
-        return None
+    def _process_single_region(self, region_name: str, screenshot: np.ndarray, 
+                             x: int, y: int, w: int, h: int, debug: bool) -> np.ndarray:
+        """Extract a single region image (errors propagate to analyze_game_state)"""
+        # Extract region image (bounds were validated when the coordinate table was built)
+        region_img = screenshot[y:y+h, x:x+w]
+        # Debug-only check that pixels are packed (e.g. 3 bytes apart for uint8 BGR)
+        assert region_img.ndim < 3 or region_img.strides[1] == region_img.itemsize * region_img.shape[2], \
+            "region crop pixels are not packed"
+        
+        if debug:
+            # Keep region image for debugging (written out by flush_debug_images)
+            self._debug_ring.append((region_name, region_img.copy()))
+        
+        return region_img
     
-    def _recognize_hero_card(self, region_img: np.ndarray, debug: bool) -> Optional[Dict]:
-        """Recognize hero card from region image"""
-        result = self.ocr_recognizer.recognize_card(region_img, debug=debug)
-        if result:
-            card_str = f"{result.rank}{result.suit}"
-            logger.info(f"Hero card detected: {card_str} (confidence: {result.confidence:.2f})")
-            return {'type': 'hero_card', 'card': card_str, 'confidence': result.confidence}
-        return None
+    def flush_debug_images(self) -> int:
+        """Write the latest buffered debug crop of each region to disk"""
+        latest = dict(self._debug_ring)
+        self._debug_ring.clear()
+        
+        for region_name, region_img in latest.items():
+            # Crops buffered before a recalibration may belong to regions no longer in the table
+            debug_filename = self._debug_names.get(region_name) or f"debug_region_{region_name}.png"
+            cv2.imwrite(debug_filename, region_img, FAST_PNG_PARAMS)
+        
+        return len(latest)
     
-    def _recognize_community_card(self, region_img: np.ndarray, debug: bool) -> Optional[Dict]:
-        """Recognize community card from region image"""
-        result = self.ocr_recognizer.recognize_card(region_img, debug=debug)
-        if result:
-            card_str = f"{result.rank}{result.suit}"
-            logger.info(f"Community card detected: {card_str} (confidence: {result.confidence:.2f})")
-            return {'type': 'community_card', 'card': card_str, 'confidence': result.confidence}
-        return None
+    def _recognize_cards(self, region_imgs: List[np.ndarray], kind: RegionKind, debug: bool) -> List[str]:
+        """Recognize hero or community cards from region images, returning card strings"""
+        label = 'Hero' if kind == RegionKind.HERO_CARD else 'Community'
+        cards = []
+        for result in self.ocr_recognizer.recognize_cards(region_imgs, debug=debug):
+            if result:
+                logger.info("%s card detected: %s%s (confidence: %.2f)",
+                            label, result.rank, result.suit, result.confidence)
+                cards.append(result.rank + result.suit)
+        return cards
     
     def _recognize_pot_info(self, region_data: Dict) -> Dict:
         """Recognize pot information from region"""
@@ -234,47 +397,52 @@ class EnhancedPokerBot:
             pot_info['text'] = region_data['ocr_text']
         return pot_info
     
-    def _add_result_to_state(self, region_result: Dict, hero_cards: list, 
-                           community_cards: list, other_info: dict) -> None:
-        """Add region result to appropriate state collections"""
-        result_type = region_result.get('type')
-        
-        if result_type == 'hero_card':
-            hero_cards.append(region_result['card'])
-        elif result_type == 'community_card':
-            community_cards.append(region_result['card'])
-        elif result_type == 'pot':
-            other_info.update(region_result)
-    
     def _save_regions_config(self):
-        """Save regions configuration to file"""
+        """Save regions configuration to file in the background"""
+        # Snapshot the regions so later recalibration cannot change what gets written
+        config = {
+            'regions': {name: dict(region) for name, region in self.regions.items()},
+            'auto_calibrated': self.auto_calibrated,
+            'timestamp': int(time.time())
+        }
+        return self._io_executor.submit(self._write_regions_config, config)
+    
+    @staticmethod
+    def _write_regions_config(config: Dict[str, Any]) -> None:
+        """Atomically write regions configuration to file"""
         try:
-            import json
-            config = {
-                'regions': self.regions,
-                'auto_calibrated': self.auto_calibrated,
-                'timestamp': int(time.time()) if 'time' in globals() else 0
-            }
-            
-            with open(ENHANCED_REGIONS_CONFIG, 'w') as f:
-                json.dump(config, f, indent=2)
+            tmp_path = ENHANCED_REGIONS_CONFIG + '.tmp'
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w') as f:
+                    json.dump(config, f, indent=2)
+            os.replace(tmp_path, ENHANCED_REGIONS_CONFIG)
             
             logger.info("Saved enhanced regions configuration")
             
         except Exception as e:
             logger.error(f"Failed to save regions config: {e}")
     
+    def close(self) -> None:
+        """Finish pending config saves and shut down the background writer"""
+        self._io_executor.shutdown(wait=True)
+    
     def load_regions_config(self) -> bool:
         """Load regions configuration from file"""
         try:
-            import json
-            
             if os.path.exists(ENHANCED_REGIONS_CONFIG):
-                with open(ENHANCED_REGIONS_CONFIG, 'r') as f:
-                    config = json.load(f)
+                if ORJSON_AVAILABLE:
+                    with open(ENHANCED_REGIONS_CONFIG, 'rb') as f:
+                        config = orjson.loads(f.read())
+                else:
+                    with open(ENHANCED_REGIONS_CONFIG, 'r') as f:
+                        config = json.load(f)
                 
                 self.regions = config.get('regions', {})
                 self.auto_calibrated = config.get('auto_calibrated', False)
+                self._on_regions_changed()
                 
                 logger.info(f"Loaded {len(self.regions)} regions from config")
                 return True
@@ -286,7 +454,7 @@ class EnhancedPokerBot:
             return False
     
     def create_visualization(self, screenshot: Optional[np.ndarray] = None) -> np.ndarray:
-        """Create visualization of detected regions"""
+        """Create visualization of detected regions (the returned image is reused by the next call)"""
         if screenshot is None:
             screenshot = self.last_screenshot
         
@@ -294,25 +462,15 @@ class EnhancedPokerBot:
             logger.error("No screenshot or regions available for visualization")
             return None
         
-        vis_img = screenshot.copy()
+        if self._vis_buf is None or self._vis_buf.shape != screenshot.shape or self._vis_buf.dtype != screenshot.dtype:
+            self._vis_buf = np.empty(screenshot.shape, dtype=screenshot.dtype)
+        vis_img = self._vis_buf
+        np.copyto(vis_img, screenshot)
         height, width = vis_img.shape[:2]
         
         # Draw regions
-        for name, region in self.regions.items():
-            x = int(region['x_percent'] * width)
-            y = int(region['y_percent'] * height)
-            w = int(region['width_percent'] * width)
-            h = int(region['height_percent'] * height)
-            
-            # Choose color based on region type
-            if 'hero' in name:
-                color = (0, 255, 0)  # Green for hero cards
-            elif 'card' in name:
-                color = (255, 0, 0)  # Red for community cards
-            elif 'pot' in name:
-                color = (0, 0, 255)  # Blue for pot
-            else:
-                color = (255, 255, 0)  # Yellow for other
+        for name, kind, x, y, w, h in self._get_region_coords(width, height):
+            color = REGION_COLORS[kind]
             
             # Draw rectangle
             cv2.rectangle(vis_img, (x, y), (x+w, y+h), color, 2)
@@ -320,6 +478,14 @@ class EnhancedPokerBot:
             # Add label
             cv2.putText(vis_img, name, (x, y-5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
         
+        # Draw out-of-bounds regions too so misplaced regions stay visible
+        for name, kind, x, y, w, h in self._invalid_coord_cache[(width, height)]:
+            cv2.rectangle(vis_img, (x, y), (x+w, y+h), INVALID_REGION_COLOR, 2)
+            label_x = min(max(x, 0), width - 1)
+            label_y = min(max(y - 5, 15), height - 1)
+            cv2.putText(vis_img, f"{name} (out of bounds)", (label_x, label_y),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, INVALID_REGION_COLOR, 1)
+        
         # Save visualization
         cv2.imwrite('enhanced_bot_visualization.png', vis_img)
         logger.info("Saved visualization as 'enhanced_bot_visualization.png'")
@@ -351,47 +517,74 @@ def upgrade_existing_bot(original_bot):
     logger.info("Bot upgrade complete!")
     return enhanced_bot
 
+# Raw decoded test screenshots, kept out of the working tree
+SCREENSHOT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'p-bot-screenshot-cache')
+
+def _load_test_screenshot(filename: str) -> Optional[np.ndarray]:
+    """
+    Load a test screenshot, reusing a raw .npy dump in SCREENSHOT_CACHE_DIR to skip image
+    decoding on later runs. Always returns a writable in-memory array.
+    """
+    key = hashlib.sha1(os.path.abspath(filename).encode('utf-8')).hexdigest()[:16]
+    cache_file = os.path.join(SCREENSHOT_CACHE_DIR, key + '.npy')
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(filename):
+            return np.load(cache_file)
+    except (OSError, ValueError):
+        pass
+    
+    screenshot = cv2.imread(filename)
+    if screenshot is not None:
+        try:
+            os.makedirs(SCREENSHOT_CACHE_DIR, exist_ok=True)
+            np.save(cache_file, screenshot)
+        except OSError as e:
+            logger.debug(f"Could not cache decoded screenshot {filename}: {e}")
+    return screenshot
+
 def test_enhanced_system():
     """Test the enhanced system with a screenshot"""
     # Create test bot
     enhanced_bot = EnhancedPokerBot()
     
-    # Try to load a test screenshot
-    test_files = ['test_table.png', 'calibration_screenshot.png', 'poker_screenshot.png']
-    screenshot = None
-    
-    for filename in test_files:
-        if os.path.exists(filename):
-            screenshot = cv2.imread(filename)
+    try:
+        # Try to load a test screenshot
+        test_files = ['test_table.png', 'calibration_screenshot.png', 'poker_screenshot.png']
+        screenshot = None
+        
+        # One directory scan instead of a stat per candidate
+        present = {entry.name for entry in os.scandir('.') if entry.is_file()}
+        filename = next((f for f in test_files if f in present), None)
+        if filename:
+            screenshot = _load_test_screenshot(filename)
             logger.info(f"Loaded test screenshot: {filename}")
-            break
-    
-    if screenshot is None:
-        logger.info("No test screenshot found. Please provide one of: " + ", ".join(test_files))
-        return
-    
-    # Test auto-calibration
-    if enhanced_bot.auto_calibrate(screenshot):
-        logger.info("✅ Auto-calibration successful!")
         
-        # Test game state analysis
-        result = enhanced_bot.analyze_game_state(screenshot, debug=True)
+        if screenshot is None:
+            logger.info("No test screenshot found. Please provide one of: " + ", ".join(test_files))
+            return
         
-        if result:
-            logger.info("✅ Game state analysis successful!")
-            logger.info(f"Result: {result}")
+        # Test auto-calibration
+        if enhanced_bot.auto_calibrate(screenshot):
+            logger.info("✅ Auto-calibration successful!")
             
-            # Create visualization
-            enhanced_bot.create_visualization(screenshot)
-            logger.info("✅ Visualization created!")
+            # Test game state analysis
+            result = enhanced_bot.analyze_game_state(screenshot, debug=True)
+            
+            if result:
+                logger.info("✅ Game state analysis successful!")
+                logger.info(f"Result: {result}")
+                
+                # Create visualization
+                enhanced_bot.create_visualization(screenshot)
+                logger.info("✅ Visualization created!")
+            else:
+                logger.error("❌ Game state analysis failed")
         else:
-            logger.error("❌ Game state analysis failed")
-    else:
-        logger.error("❌ Auto-calibration failed")
+            logger.error("❌ Auto-calibration failed")
+    finally:
+        enhanced_bot.close()
 
 if __name__ == "__main__":
-    import time
-    
     print("="*60)
     print("ENHANCED POKER BOT INTEGRATION SYSTEM")
     print("="*60)
@@ -3,13 +3,34 @@ Enhanced OCR Card Recognition System
 Works with table reference system for accurate card detection
 """
 
+import os
+import sys
+import atexit
+import hashlib
+import threading
+import queue
 import cv2
 import numpy as np
 import pytesseract
 from typing import Tuple, Optional, List, Dict
 import logging
 from dataclasses import dataclass
+from collections import OrderedDict, Counter
+from bisect import bisect_right
+from functools import lru_cache
 import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# One Tesseract thread per OCR call; parallelism comes from the region worker pool instead.
+# Must be set before the Tesseract library is loaded (worker processes inherit it).
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# Persistent in-process Tesseract API (avoids a tesseract subprocess per OCR call)
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
 
 # Configure Tesseract for this module
 from tesseract_config import configure_tesseract
@@ -17,7 +38,164 @@ configure_tesseract()
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+RESULT_CACHE_SIZE = 256
+OCR_WORKERS = min(4, os.cpu_count() or 1)
+DEBUG_QUEUE_SIZE = 256
+
+# Suit symbol template matching: BGR glyphs cropped from client card corners, named <suit>.png.
+# Suits without a glyph file fall back to OCR of the symbol region.
+SUIT_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'card_templates', 'suits')
+SYMBOL_MATCH_THRESHOLD = 0.85   # Best template score needed to accept a suit
+SYMBOL_MATCH_MARGIN = 0.1       # Required lead over the second-best suit (club/spade shapes are close)
+FAST_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+# Corner OCR configurations (page segmentation mode, whitelist) for better 10 detection
+CORNER_OCR_CONFIGS = (
+    (8, '10023456789TJQKA'),  # Include '10' specifically
+    (10, '23456789TJQKA10'),  # Single character
+    (13, None),  # Raw line, treat the image as a single text line
+    (6, None)    # Single uniform block of text
+)
+CORNER_CONFIDENT = 80           # Word confidence that ends the corner OCR search
+CORNER_REORDER_INTERVAL = 32    # Re-rank corner configs by success every N hits
+
+# Batch corner OCR: preprocessed corners tiled side by side and read with sparse text segmentation
+BATCH_OCR_PSM = 11
+BATCH_OCR_WHITELIST = '10023456789TJQKA'
+BATCH_TILE_GAP = 20
+# Below single-card corner OCR (0.8/0.9): one sparse read of tiled corners is less trustworthy
+BATCH_OCR_CONFIDENCE = 0.7
+
+# Rank patterns for better OCR (order matters - longer patterns first)
+RANK_PATTERNS = {
+    'A': ['A', '4', 'a'],  # Common OCR mistakes
+    'K': ['K', 'k'],
+    'Q': ['Q', 'q', '0'],
+    'J': ['J', 'j'],  # Removed '1' to avoid conflict with 10
+    'T': ['10', '1O', 'l0', 'T', 't'],  # 10 patterns first, before single chars
+    '9': ['9', 'g'],
+    '8': ['8', 'B'],
+    '7': ['7'],  # Removed '1' to avoid conflict with 10
+    '6': ['6', 'b'],
+    '5': ['5', 'S'],
+    '4': ['4', 'A'],
+    '3': ['3'],
+    '2': ['2', 'Z']
+}
+
+# (pattern, rank) pairs in match priority order: longest pattern first, then by rank
+_RANK_PATTERN_PRIORITY = tuple(
+    (pattern.upper(), rank)
+    for _, rank, pattern in sorted(
+        ((len(pattern), rank, pattern) for rank, patterns in RANK_PATTERNS.items() for pattern in patterns),
+        key=lambda x: (-x[0], x[1])
+    )
+)
+
+# Upper-cased (pattern, rank) pairs in RANK_PATTERNS order, for substring search of full-card text
+_RANK_PATTERNS_FLAT = tuple(
+    (pattern.upper(), rank) for rank, patterns in RANK_PATTERNS.items() for pattern in patterns
+)
+
+# Suit names that full-card OCR may read
+_SUIT_WORDS = {
+    'HEART': 'h', 'HEARTS': 'h',
+    'DIAMOND': 'd', 'DIAMONDS': 'd',
+    'CLUB': 'c', 'CLUBS': 'c',
+    'SPADE': 's', 'SPADES': 's'
+}
+
+# Two-character OCR readings of "10"
+_TEN_BIGRAMS = frozenset(('10', '1O', 'L0', 'IO', '1Q', 'LO'))
+
+# Single character -> (priority, rank) for its highest-priority pattern; every
+# multi-character pattern is a reading of 10 and is caught by _TEN_BIGRAMS first
+_CHAR_RANKS = {
+    pattern: (priority, rank)
+    for priority, (pattern, rank) in reversed(list(enumerate(_RANK_PATTERN_PRIORITY)))
+    if len(pattern) == 1
+}
+
+@lru_cache(maxsize=1024)
+def _match_rank_text(text: str) -> Optional[str]:
+    """Match stripped, upper-cased OCR text to a rank (OCR strings recur constantly, so results are memoized)"""
+    # Special handling for 10 detection
+    for i in range(len(text) - 1):
+        if text[i:i + 2] in _TEN_BIGRAMS:
+            return 'T'
+    
+    # Direct match first
+    if text in RANK_PATTERNS:
+        return text
+    
+    # Otherwise the highest-priority pattern character anywhere in the text wins
+    matches = [_CHAR_RANKS[char] for char in text if char in _CHAR_RANKS]
+    return min(matches)[1] if matches else None
+
+_CACHE_MISS = object()
+
+_debug_queue = queue.Queue(maxsize=DEBUG_QUEUE_SIZE)
+_debug_writer = None
+_debug_writer_lock = threading.Lock()
+
+def _debug_writer_loop():
+    """Write queued debug images to disk"""
+    while True:
+        filename, img = _debug_queue.get()
+        try:
+            cv2.imwrite(filename, img, FAST_PNG_PARAMS)
+            logger.info(f"Saved debug image: {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save debug image {filename}: {e}")
+
+def _queue_debug_image(filename: str, img: np.ndarray) -> None:
+    """Hand a debug image to the background writer, starting it on first use"""
+    global _debug_writer
+    if _debug_writer is None:
+        with _debug_writer_lock:
+            if _debug_writer is None:
+                _debug_writer = threading.Thread(target=_debug_writer_loop, name='ocr-debug-writer', daemon=True)
+                _debug_writer.start()
+    
+    try:
+        _debug_queue.put_nowait((filename, img.copy()))
+    except queue.Full:
+        logger.debug(f"Debug image queue full, dropping {filename}")
+
+def _load_suit_templates(suit_codes: Dict[str, str]) -> List[Tuple[str, np.ndarray]]:
+    """Load the (suit code, BGR glyph) templates available in SUIT_TEMPLATE_DIR"""
+    templates = []
+    missing = []
+    for suit, code in suit_codes.items():
+        path = os.path.join(SUIT_TEMPLATE_DIR, f'{suit}.png')
+        template = cv2.imread(path) if os.path.exists(path) else None
+        if template is None:
+            missing.append(suit)
+        else:
+            templates.append((code, template))
+    
+    if missing:
+        logger.debug(f"No suit glyph templates for {missing}, using OCR for those symbols")
+    return templates
+
+def _create_tess_api():
+    """Create a persistent Tesseract API using the configured installation, or None if unavailable"""
+    if not TESSEROCR_AVAILABLE:
+        return None
+    
+    tessdata = os.path.join(os.path.dirname(pytesseract.pytesseract.tesseract_cmd), 'tessdata')
+    try:
+        if os.path.isdir(tessdata):
+            return PyTessBaseAPI(path=tessdata + os.sep, lang='eng')
+        return PyTessBaseAPI(lang='eng')
+    except RuntimeError as e:
+        logger.warning(f"tesserocr could not be initialized, using pytesseract: {e}")
+        return None
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep the plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class CardResult:
     """Result of card recognition"""
     rank: str
@@ -62,22 +240,43 @@ class EnhancedOCRCardRecognition:
             }
         }
         
-        # Rank patterns for better OCR (order matters - longer patterns first)
-        self.rank_patterns = {
-            'A': ['A', '4', 'a'],  # Common OCR mistakes
-            'K': ['K', 'k'],
-            'Q': ['Q', 'q', '0'],
-            'J': ['J', 'j'],  # Removed '1' to avoid conflict with 10
-            'T': ['10', '1O', 'l0', 'T', 't'],  # 10 patterns first, before single chars
-            '9': ['9', 'g'],
-            '8': ['8', 'B'],
-            '7': ['7'],  # Removed '1' to avoid conflict with 10
-            '6': ['6', 'b'],
-            '5': ['5', 'S'],
-            '4': ['4', 'A'],
-            '3': ['3'],
-            '2': ['2', 'Z']
-        }
+        # Suit attributes as parallel arrays in suit_colors order; HSV bounds stacked as (4, 3)
+        # arrays for single-pass masking
+        self._suit_lower = np.stack([info['hsv_lower'] for info in self.suit_colors.values()]).astype(np.uint8)
+        self._suit_upper = np.stack([info['hsv_upper'] for info in self.suit_colors.values()]).astype(np.uint8)
+        self._suit_codes = [info['code'] for info in self.suit_colors.values()]
+        
+        # Suits grouped by shared saturation/value bounds: each group's suits differ only by hue,
+        # so one hue histogram per group counts all of them
+        sv_groups = OrderedDict()
+        for idx, (lower, upper) in enumerate(zip(self._suit_lower, self._suit_upper)):
+            sv_groups.setdefault((tuple(lower[1:]), tuple(upper[1:])), []).append(idx)
+        self._suit_sv_groups = [
+            (np.array(sv_lower, dtype=np.uint8), np.array(sv_upper, dtype=np.uint8), np.array(suits),
+             self._suit_lower[suits, 0].astype(np.intp), self._suit_upper[suits, 0].astype(np.intp) + 1)
+            for (sv_lower, sv_upper), suits in sv_groups.items()
+        ]
+        self._suit_symbols = [info['symbol'] for info in self.suit_colors.values()]
+        self._suit_templates = _load_suit_templates({name: info['code'] for name, info in self.suit_colors.items()})
+        
+        # Rank patterns for better OCR
+        self.rank_patterns = RANK_PATTERNS
+        
+        # Structuring element for edge dilation (read-only, shared by all threads)
+        self._edge_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+        
+        # Per-thread OCR engine and contrast enhancer (neither is safe to share between threads)
+        self._local = threading.local()
+        
+        # Guards the result cache and corner config statistics
+        self._lock = threading.Lock()
+        
+        # Corner OCR configs, periodically re-ordered so the most successful one runs first
+        self._corner_configs = list(CORNER_OCR_CONFIGS)
+        self._corner_config_hits = Counter()
+        
+        # LRU of recognition results keyed by exact image content (cards sit unchanged for many frames)
+        self._result_cache = OrderedDict()
         
     def recognize_card(self, card_img: np.ndarray, debug=False) -> Optional[CardResult]:
         """
@@ -93,9 +292,60 @@ class EnhancedOCRCardRecognition:
         if card_img is None or card_img.size == 0:
             return None
         
-        # Check if card is present
-        if not self._is_card_present(card_img):
-            return None
+        # Identical pixels give identical results, including "no card"
+        cache_key = self._cache_key(card_img)
+        cached = self._cache_get(cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        
+        result = self._recognize_uncached(card_img, debug)
+        self._cache_put(cache_key, result)
+        return result
+    
+    def _cache_get(self, cache_key: Tuple):
+        """Look up a cached result, returning _CACHE_MISS if absent"""
+        with self._lock:
+            cached = self._result_cache.get(cache_key, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                self._result_cache.move_to_end(cache_key)
+            return cached
+    
+    def _cache_put(self, cache_key: Tuple, result: Optional[CardResult]) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    @property
+    def _api(self):
+        """Persistent OCR engine for the calling thread; None means pytesseract is used"""
+        local = self._local
+        if not hasattr(local, 'api'):
+            local.api = _create_tess_api()
+        return local.api
+    
+    @property
+    def _clahe(self):
+        """Contrast enhancer for the calling thread"""
+        local = self._local
+        if not hasattr(local, 'clahe'):
+            local.clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
+        return local.clahe
+    
+    @staticmethod
+    def _cache_key(card_img: np.ndarray) -> Tuple:
+        """Exact content key for a card image"""
+        data = np.ascontiguousarray(card_img)
+        return data.shape, data.dtype.str, hashlib.blake2b(data.data, digest_size=16).digest()
+    
+    def _recognize_uncached(self, card_img: np.ndarray, debug: bool,
+                            gray: Optional[np.ndarray] = None) -> Optional[CardResult]:
+        """Run the recognition cascade on a card image"""
+        # Every method works from the same single-channel copy of the card
+        local = self._local
+        local.gray_src = card_img
+        local.gray = cv2.cvtColor(card_img, cv2.COLOR_BGR2GRAY) if gray is None else gray
         
         # Try multiple recognition methods
         methods = [
@@ -105,27 +355,158 @@ class EnhancedOCRCardRecognition:
             self._recognize_by_full_ocr
         ]
         
-        for method in methods:
-            try:
-                result = method(card_img)
-                if result and result.confidence > 0.6:
-                    if debug:
-                        self._save_debug_image(card_img, result)
-                    return result
-            except Exception as e:
-                logger.error(f"Recognition method {method.__name__} failed: {e}")
-                continue
+        try:
+            # Check if card is present
+            if not self._is_card_present(local.gray):
+                return None
+            
+            for method in methods:
+                try:
+                    result = method(card_img)
+                    if result and result.confidence > 0.6:
+                        if debug:
+                            self._save_debug_image(card_img, result)
+                        return result
+                except Exception as e:
+                    logger.error(f"Recognition method {method.__name__} failed: {e}")
+                    continue
+        finally:
+            # The conversions are only shared within one card's cascade
+            local.gray_src = local.gray = local.hsv_src = local.hsv = None
         
         return None
     
-    def _is_card_present(self, img: np.ndarray) -> bool:
-        """Check if image contains a card"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img
+    def _card_gray(self, card_img: np.ndarray) -> np.ndarray:
+        """Grayscale version of the card being recognized, converted once per recognition"""
+        local = self._local
+        if getattr(local, 'gray_src', None) is not card_img:
+            local.gray = cv2.cvtColor(card_img, cv2.COLOR_BGR2GRAY)
+            local.gray_src = card_img
+        return local.gray
+    
+    def _card_hsv(self, card_img: np.ndarray) -> np.ndarray:
+        """HSV version of the card being recognized, converted once per recognition"""
+        local = self._local
+        if getattr(local, 'hsv_src', None) is not card_img:
+            local.hsv = cv2.cvtColor(card_img, cv2.COLOR_BGR2HSV)
+            local.hsv_src = card_img
+        return local.hsv
+    
+    def recognize_cards(self, card_imgs: List[np.ndarray], debug=False) -> List[Optional[CardResult]]:
+        """
+        Recognize a batch of cards
         
-        # Check brightness and contrast
-        mean_brightness = np.mean(gray)
-        std_dev = np.std(gray)
+        Args:
+            card_imgs: Images of the cards
+            debug: Save debug images
+            
+        Returns:
+            One CardResult (or None) per input image, in the same order
+        """
+        results = [None] * len(card_imgs)
+        
+        # Resolve empty slots and cached cards; collect the rest for batch OCR
+        pending = []
+        for i, card_img in enumerate(card_imgs):
+            if card_img is None or card_img.size == 0:
+                continue
+            cache_key = self._cache_key(card_img)
+            cached = self._cache_get(cache_key)
+            if cached is not _CACHE_MISS:
+                results[i] = cached
+                continue
+            gray = cv2.cvtColor(card_img, cv2.COLOR_BGR2GRAY)
+            if not self._is_card_present(gray):
+                self._cache_put(cache_key, None)
+            else:
+                pending.append((i, cache_key, gray))
+        
+        # One OCR call for all card corners; cards it cannot read go through the full cascade
+        if len(pending) > 1:
+            batch_results = self._batch_corner_ocr([card_imgs[i] for i, _, _ in pending],
+                                                   [gray for _, _, gray in pending])
+        else:
+            batch_results = [None] * len(pending)
+        
+        for (i, cache_key, gray), result in zip(pending, batch_results):
+            if result is None:
+                result = self._recognize_uncached(card_imgs[i], debug, gray)
+            elif debug:
+                self._save_debug_image(card_imgs[i], result)
+            self._cache_put(cache_key, result)
+            results[i] = result
+        
+        return results
+    
+    def _batch_corner_ocr(self, card_imgs: List[np.ndarray],
+                          grays: List[np.ndarray]) -> List[Optional[CardResult]]:
+        """Read the ranks of several cards with a single OCR call on their tiled corners"""
+        try:
+            corners = []
+            processed = []
+            for card_img, gray in zip(card_imgs, grays):
+                h, w = card_img.shape[:2]
+                corners.append(card_img[0:int(h*0.25), 0:int(w*0.25)])
+                processed.append(self._preprocess_for_ocr(gray[0:int(h*0.25), 0:int(w*0.25)]))
+            
+            # Tile the binarized corners left to right on a white background
+            gap = BATCH_TILE_GAP
+            height = max(tile.shape[0] for tile in processed) + 2 * gap
+            width = sum(tile.shape[1] for tile in processed) + gap * (len(processed) + 1)
+            composite = np.full((height, width), 255, dtype=np.uint8)
+            offsets = []
+            x = gap
+            for tile in processed:
+                composite[gap:gap + tile.shape[0], x:x + tile.shape[1]] = tile
+                offsets.append(x)
+                x += tile.shape[1] + gap
+            
+            # Assign each word to the tile containing it, keeping the most confident rank
+            tile_ends = [offset + tile.shape[1] for offset, tile in zip(offsets, processed)]
+            best = [(None, 0)] * len(processed)
+            for text, conf, left, box_width in self._ocr_word_boxes(composite, BATCH_OCR_PSM, BATCH_OCR_WHITELIST):
+                if conf <= 30:  # Minimum confidence
+                    continue
+                tile_idx = bisect_right(offsets, left) - 1
+                if tile_idx < 0 or left + box_width > tile_ends[tile_idx]:
+                    # Starts in a gap or runs into the next tile: ranks of neighbouring cards merged
+                    continue
+                rank = self._match_rank_pattern(text)
+                if rank and conf > best[tile_idx][1]:
+                    best[tile_idx] = (rank, conf)
+        
+        except Exception as e:
+            logger.debug(f"Batch corner OCR failed, recognizing cards individually: {e}")
+            return [None] * len(card_imgs)
+        
+        # Suits for every read corner in one HSV conversion
+        ranked = [i for i, (rank, _) in enumerate(best) if rank]
+        suits = [None] * len(corners)
+        for i, suit in zip(ranked, self._detect_suits_by_color([corners[i] for i in ranked])):
+            suits[i] = suit
+        
+        results = []
+        for (rank, _), suit in zip(best, suits):
+            if rank and suit:
+                results.append(CardResult(
+                    rank=rank,
+                    suit=suit,
+                    confidence=BATCH_OCR_CONFIDENCE,
+                    method='batch_corner_ocr'
+                ))
+            else:
+                results.append(None)
+        return results
+    
+    def _is_card_present(self, gray: np.ndarray) -> bool:
+        """Check if a grayscale image contains a card"""
+        # Brightness/contrast statistics are stable on a 1-in-16 pixel sample
+        probe = np.ascontiguousarray(gray[::4, ::4])
+        
+        # Check brightness and contrast (one SIMD pass for both)
+        mean, std = cv2.meanStdDev(probe)
+        mean_brightness = mean[0, 0]
+        std_dev = std[0, 0]
         
         # Card should have reasonable brightness and contrast
         return mean_brightness > 50 and std_dev > 20
@@ -138,53 +519,35 @@ class EnhancedOCRCardRecognition:
         corner_region = card_img[0:int(h*0.25), 0:int(w*0.25)]
         
         # Preprocess for OCR
-        processed = self._preprocess_for_ocr(corner_region)
-        
-        # Try multiple OCR configurations for better 10 detection
-        ocr_configs = [
-            '--psm 8 -c tessedit_char_whitelist=10023456789TJQKA',  # Include '10' specifically
-            '--psm 10 -c tessedit_char_whitelist=23456789TJQKA10',  # Single uniform block
-            '--psm 13',  # Raw line, treat the image as a single text line
-            '--psm 6'   # Single uniform block of text
-        ]
+        processed = self._preprocess_for_ocr(self._card_gray(card_img)[0:int(h*0.25), 0:int(w*0.25)])
         
         rank = None
         best_confidence = 0
         
-        for config in ocr_configs:
+        for config in self._corner_configs:
+            psm, whitelist = config
             try:
-                # Get OCR data with confidence
-                ocr_data = pytesseract.image_to_data(processed, config=config, output_type=pytesseract.Output.DICT)
-                
-                # Extract text with confidence
-                texts = []
-                confidences = []
-                for i, conf in enumerate(ocr_data['conf']):
-                    if int(conf) > 30:  # Minimum confidence
-                        text = ocr_data['text'][i].strip()
-                        if text:
-                            texts.append(text)
-                            confidences.append(int(conf))
-                
-                # Try each detected text
-                for text, conf in zip(texts, confidences):
-                    detected_rank = self._match_rank_pattern(text)
-                    if detected_rank and conf > best_confidence:
-                        rank = detected_rank
-                        best_confidence = conf
-                
-                if rank:
-                    break
+                # Get OCR words with confidence
+                for text, conf in self._ocr_words(processed, psm, whitelist):
+                    if conf > 30:  # Minimum confidence
+                        detected_rank = self._match_rank_pattern(text)
+                        if detected_rank and conf > best_confidence:
+                            rank = detected_rank
+                            best_confidence = conf
+                            if conf > CORNER_CONFIDENT:
+                                break
                     
             except Exception:
                 # Fallback to simple OCR
-                rank_text = pytesseract.image_to_string(processed, config=config).strip()
+                rank_text = self._ocr_string(processed, psm, whitelist)
                 rank = self._match_rank_pattern(rank_text)
-                if rank:
-                    break
+            
+            if rank:
+                self._record_corner_config_hit(config)
+                break
         
         # Detect suit by color
-        suit = self._detect_suit_by_color(corner_region)
+        suit = self._detect_suit_by_color(corner_region, self._card_hsv(card_img)[0:int(h*0.25), 0:int(w*0.25)])
         
         if rank and suit:
             # Higher confidence for better OCR results
@@ -198,34 +561,37 @@ class EnhancedOCRCardRecognition:
         
         return None
     
+    def _record_corner_config_hit(self, config: Tuple) -> None:
+        """Count a successful corner config and periodically move the best ones first"""
+        with self._lock:
+            self._corner_config_hits[config] += 1
+            if sum(self._corner_config_hits.values()) % CORNER_REORDER_INTERVAL == 0:
+                # Stable sort keeps the original order between configs with equal hits;
+                # a new list is swapped in so concurrent readers keep iterating the old one
+                self._corner_configs = sorted(self._corner_configs, key=lambda c: -self._corner_config_hits[c])
+    
     def _recognize_by_symbol_matching(self, card_img: np.ndarray) -> Optional[CardResult]:
         """Recognize by matching suit symbols"""
         h, w = card_img.shape[:2]
+        gray = self._card_gray(card_img)
         
         # Look for suit symbols in typical locations
         symbol_regions = [
-            card_img[int(h*0.15):int(h*0.35), int(w*0.15):int(w*0.35)],  # Top-left
-            card_img[int(h*0.65):int(h*0.85), int(w*0.65):int(w*0.85)]   # Bottom-right
+            (slice(int(h*0.28), int(h*0.58)), slice(0, int(w*0.4))),               # Corner suit under the rank
+            (slice(int(h*0.15), int(h*0.35)), slice(int(w*0.15), int(w*0.35))),    # Top-left
+            (slice(int(h*0.65), int(h*0.85)), slice(int(w*0.65), int(w*0.85)))     # Bottom-right
         ]
         
         suit = None
         for region in symbol_regions:
-            # OCR for suit symbols
-            symbol_config = '--psm 10 -c tessedit_char_whitelist=♠♥♦♣'
-            symbol_text = pytesseract.image_to_string(region, config=symbol_config).strip()
-            
-            for suit_name, suit_info in self.suit_colors.items():
-                if suit_info['symbol'] in symbol_text:
-                    suit = suit_info['code']
-                    break
-            
+            suit = self._match_suit_symbol(card_img[region]) or self._ocr_suit_symbol(gray[region])
             if suit:
                 break
         
         # Get rank from corner
-        corner_region = card_img[0:int(h*0.2), 0:int(w*0.3)]
+        corner_region = gray[0:int(h*0.2), 0:int(w*0.3)]
         processed = self._preprocess_for_ocr(corner_region)
-        rank_text = pytesseract.image_to_string(processed, config='--psm 8').strip()
+        rank_text = self._ocr_string(processed, 8)
         rank = self._match_rank_pattern(rank_text)
         
         if rank and suit:
@@ -238,32 +604,55 @@ class EnhancedOCRCardRecognition:
         
         return None
     
+    def _match_suit_symbol(self, region: np.ndarray) -> Optional[str]:
+        """Identify a suit symbol by correlating a BGR region against the client's suit glyphs"""
+        scores = []
+        for code, template in self._suit_templates:
+            if region.shape[0] < template.shape[0] or region.shape[1] < template.shape[1]:
+                continue
+            scores.append((cv2.minMaxLoc(cv2.matchTemplate(region, template, cv2.TM_CCOEFF_NORMED))[1], code))
+        
+        if not scores:
+            return None
+        
+        scores.sort(reverse=True)
+        best_score, best_code = scores[0]
+        runner_up = scores[1][0] if len(scores) > 1 else 0.0
+        if best_score >= SYMBOL_MATCH_THRESHOLD and best_score - runner_up >= SYMBOL_MATCH_MARGIN:
+            return best_code
+        return None
+    
+    def _ocr_suit_symbol(self, region: np.ndarray) -> Optional[str]:
+        """Read a suit symbol with OCR (fallback for suits without a glyph template)"""
+        if region.size == 0:
+            return None
+        
+        symbol_text = self._ocr_string(region, 10, '♠♥♦♣')
+        for symbol, code in zip(self._suit_symbols, self._suit_codes):
+            if symbol in symbol_text:
+                return code
+        return None
+    
     def _recognize_by_color_and_ocr(self, card_img: np.ndarray) -> Optional[CardResult]:
         """Recognize using color analysis and OCR combined"""
         # Detect suit by dominant color
-        suit = self._detect_suit_by_dominant_color(card_img)
+        suit = self._detect_suit_by_dominant_color(card_img, self._card_hsv(card_img))
         
         # Get rank by OCR on entire card
-        gray = cv2.cvtColor(card_img, cv2.COLOR_BGR2GRAY)
-        
-        # Multiple preprocessing attempts
-        preprocessed_images = [
-            self._preprocess_for_ocr(gray),
-            self._preprocess_with_edge_detection(gray),
-            self._preprocess_with_adaptive_threshold(gray)
-        ]
+        gray = self._card_gray(card_img)
         
+        # Multiple preprocessing attempts, each computed only if the previous one failed
         rank = None
-        for processed in preprocessed_images:
+        for processed in self._preprocessing_variants(gray):
             # OCR with different configs
             configs = [
-                '--psm 8 -c tessedit_char_whitelist=23456789TJQKA',
-                '--psm 10 -c tessedit_char_whitelist=23456789TJQKA10',
-                '--psm 13'
+                (8, '23456789TJQKA'),
+                (10, '23456789TJQKA10'),
+                (13, None)
             ]
             
-            for config in configs:
-                text = pytesseract.image_to_string(processed, config=config).strip()
+            for psm, whitelist in configs:
+                text = self._ocr_string(processed, psm, whitelist)
                 rank = self._match_rank_pattern(text)
                 if rank:
                     break
@@ -281,44 +670,39 @@ class EnhancedOCRCardRecognition:
         
         return None
     
+    def _preprocessing_variants(self, gray: np.ndarray):
+        """Yield OCR preprocessing variants of a grayscale image, most reliable first"""
+        yield self._preprocess_for_ocr(gray)
+        yield self._preprocess_with_edge_detection(gray)
+        yield self._preprocess_with_adaptive_threshold(gray)
+    
     def _recognize_by_full_ocr(self, card_img: np.ndarray) -> Optional[CardResult]:
         """Last resort: OCR the entire card"""
         # Preprocess
-        gray = cv2.cvtColor(card_img, cv2.COLOR_BGR2GRAY)
-        processed = self._preprocess_for_ocr(gray)
+        processed = self._preprocess_for_ocr(self._card_gray(card_img))
         
         # Full OCR
-        full_text = pytesseract.image_to_string(processed).strip().upper()
+        full_text = self._ocr_string(processed).upper()
         
         # Look for rank and suit in text
         rank = None
         suit = None
         
         # Check for ranks
-        for r, patterns in self.rank_patterns.items():
-            for pattern in patterns:
-                if pattern.upper() in full_text:
-                    rank = r
-                    break
-            if rank:
+        for pattern, r in _RANK_PATTERNS_FLAT:
+            if pattern in full_text:
+                rank = r
                 break
         
         # Check for suit words
-        suit_words = {
-            'HEART': 'h', 'HEARTS': 'h',
-            'DIAMOND': 'd', 'DIAMONDS': 'd',
-            'CLUB': 'c', 'CLUBS': 'c',
-            'SPADE': 's', 'SPADES': 's'
-        }
-        
-        for word, code in suit_words.items():
+        for word, code in _SUIT_WORDS.items():
             if word in full_text:
                 suit = code
                 break
         
         # If no suit word found, use color
         if not suit:
-            suit = self._detect_suit_by_color(card_img)
+            suit = self._detect_suit_by_color(card_img, self._card_hsv(card_img))
         
         if rank and suit:
             return CardResult(
@@ -330,19 +714,79 @@ class EnhancedOCRCardRecognition:
         
         return None
     
-    def _preprocess_for_ocr(self, img: np.ndarray) -> np.ndarray:
-        """Standard preprocessing for OCR"""
-        if len(img.shape) == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img
+    @staticmethod
+    def _set_api_image(api, img: np.ndarray) -> None:
+        """Load a grayscale or 3-channel image into a persistent API"""
+        height, width = img.shape[:2]
+        bytes_per_pixel = img.shape[2] if img.ndim == 3 else 1
+        api.SetImageBytes(img.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+    
+    @staticmethod
+    def _configure_api(api, psm: int, whitelist: Optional[str]) -> None:
+        """Apply page segmentation mode and character whitelist to a persistent API"""
+        api.SetPageSegMode(psm)
+        api.SetVariable('tessedit_char_whitelist', whitelist or '')
+    
+    def _ocr_string(self, img: np.ndarray, psm: int = 3, whitelist: Optional[str] = None) -> str:
+        """OCR an image to stripped text"""
+        api = self._api
+        if api is not None:
+            self._configure_api(api, psm, whitelist)
+            self._set_api_image(api, img)
+            return api.GetUTF8Text().strip()
         
-        # Denoise
-        denoised = cv2.fastNlMeansDenoising(gray)
+        return pytesseract.image_to_string(img, config=self._tesseract_config(psm, whitelist)).strip()
+    
+    def _ocr_words(self, img: np.ndarray, psm: int, whitelist: Optional[str] = None) -> List[Tuple[str, int]]:
+        """OCR an image to a list of (word, confidence) pairs"""
+        return [(text, conf) for text, conf, _, _ in self._ocr_word_boxes(img, psm, whitelist)]
+    
+    def _ocr_word_boxes(self, img: np.ndarray, psm: int,
+                        whitelist: Optional[str] = None) -> List[Tuple[str, int, int, int]]:
+        """OCR an image to a list of (word, confidence, left, width) tuples"""
+        api = self._api
+        if api is not None:
+            self._configure_api(api, psm, whitelist)
+            self._set_api_image(api, img)
+            api.Recognize()
+            iterator = api.GetIterator()
+            if iterator is None:
+                return []
+            words = []
+            for word in iterate_level(iterator, RIL.WORD):
+                text = (word.GetUTF8Text(RIL.WORD) or '').strip()
+                box = word.BoundingBox(RIL.WORD)
+                if text and box:
+                    words.append((text, int(word.Confidence(RIL.WORD)), box[0], box[2] - box[0]))
+            return words
+        
+        ocr_data = pytesseract.image_to_data(img, config=self._tesseract_config(psm, whitelist),
+                                             output_type=pytesseract.Output.DICT)
+        words = []
+        for text, conf, left, width in zip(ocr_data['text'], ocr_data['conf'], ocr_data['left'], ocr_data['width']):
+            text = text.strip()
+            if text:
+                words.append((text, int(float(conf)), int(left), int(width)))
+        return words
+    
+    @staticmethod
+    def _tesseract_config(psm: int, whitelist: Optional[str]) -> str:
+        """Build a pytesseract config string"""
+        config = f'--psm {psm}'
+        if whitelist:
+            config += f' -c tessedit_char_whitelist={whitelist}'
+        return config
+    
+    def _preprocess_for_ocr(self, gray: np.ndarray) -> np.ndarray:
+        """Standard preprocessing for OCR on a grayscale image"""
+        # Denoise (clean high-contrast UI renders need none)
+        if gray.std() > 40:
+            denoised = gray
+        else:
+            denoised = cv2.medianBlur(gray, 3)
         
         # Increase contrast
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-        enhanced = clahe.apply(denoised)
+        enhanced = self._clahe.apply(denoised)
         
         # Binary threshold
         _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -355,8 +799,7 @@ class EnhancedOCRCardRecognition:
         edges = cv2.Canny(img, 50, 150)
         
         # Dilate to connect edges
-        kernel = np.ones((2,2), np.uint8)
-        dilated = cv2.dilate(edges, kernel, iterations=1)
+        dilated = cv2.dilate(edges, self._edge_kernel, iterations=1)
         
         return dilated
     
@@ -370,43 +813,65 @@ class EnhancedOCRCardRecognition:
         
         return adaptive
     
-    def _detect_suit_by_color(self, img: np.ndarray) -> Optional[str]:
+    def _detect_suit_by_color(self, img: np.ndarray, hsv: Optional[np.ndarray] = None) -> Optional[str]:
         """Detect suit by analyzing dominant color"""
-        # Convert to HSV
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        # Convert to HSV unless the caller already has it
+        if hsv is None:
+            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        hue = hsv[:, :, 0]
+        sat_val = hsv[:, :, 1:]
         
-        # Check each suit color
-        max_pixels = 0
-        detected_suit = None
-        
-        for suit_name, suit_info in self.suit_colors.items():
-            # Create mask
-            mask = cv2.inRange(hsv, suit_info['hsv_lower'], suit_info['hsv_upper'])
-            pixel_count = cv2.countNonZero(mask)
-            
-            if pixel_count > max_pixels:
-                max_pixels = pixel_count
-                detected_suit = suit_info['code']
+        # Count pixels inside each suit's range from cumulative hue histograms
+        counts = np.zeros(len(self._suit_codes), dtype=np.intp)
+        for sv_lower, sv_upper, suits, hue_start, hue_end in self._suit_sv_groups:
+            mask = ((sat_val >= sv_lower) & (sat_val <= sv_upper)).all(axis=-1)
+            cumulative = np.concatenate(([0], np.cumsum(np.bincount(hue[mask], minlength=256))))
+            counts[suits] = cumulative[hue_end] - cumulative[hue_start]
+        best = int(counts.argmax())
         
         # Need minimum pixels to be confident
-        if max_pixels > 50:
-            return detected_suit
+        if counts[best] > 50:
+            return self._suit_codes[best]
         
         return None
     
-    def _detect_suit_by_dominant_color(self, img: np.ndarray) -> Optional[str]:
+    def _detect_suits_by_color(self, imgs: List[np.ndarray]) -> List[Optional[str]]:
+        """Detect the suits of several images with a single HSV conversion and mask pass"""
+        suits = [None] * len(imgs)
+        filled = [i for i, img in enumerate(imgs) if img.size]
+        if not filled:
+            return suits
+        
+        # Stack every image's pixels into one column so one conversion covers them all
+        pixels = np.concatenate([imgs[i].reshape(-1, 1, 3) for i in filled])
+        hsv = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
+        
+        # (P, 4) in-range mask, summed per image segment
+        in_range = ((hsv >= self._suit_lower) & (hsv <= self._suit_upper)).all(axis=-1)
+        sizes = [imgs[i].shape[0] * imgs[i].shape[1] for i in filled]
+        starts = np.concatenate(([0], np.cumsum(sizes[:-1])))
+        counts = np.add.reduceat(in_range, starts, axis=0, dtype=np.intp)
+        best = counts.argmax(axis=1)
+        
+        # Need minimum pixels to be confident
+        for i, suit_idx, suit_counts in zip(filled, best, counts):
+            if suit_counts[suit_idx] > 50:
+                suits[i] = self._suit_codes[suit_idx]
+        
+        return suits
+    
+    def _detect_suit_by_dominant_color(self, img: np.ndarray, hsv: Optional[np.ndarray] = None) -> Optional[str]:
         """Detect suit by the most dominant color in the image"""
         # Get average color in HSV
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        avg_color = np.mean(hsv.reshape(-1, 3), axis=0)
+        if hsv is None:
+            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        avg_color = np.array(cv2.mean(hsv)[:3])
         
-        # Check which suit color range it falls into
-        for suit_name, suit_info in self.suit_colors.items():
-            lower = suit_info['hsv_lower']
-            upper = suit_info['hsv_upper']
-            
-            if all(lower[i] <= avg_color[i] <= upper[i] for i in range(3)):
-                return suit_info['code']
+        # Check which suit color ranges it falls into, all suits at once; first match wins
+        inside = ((avg_color >= self._suit_lower) & (avg_color <= self._suit_upper)).all(axis=1)
+        matches = np.flatnonzero(inside)
+        if matches.size:
+            return self._suit_codes[matches[0]]
         
         return None
     
@@ -415,65 +880,22 @@ class EnhancedOCRCardRecognition:
         if not text:
             return None
         
-        text = text.strip().upper()
-        
-        # Special handling for 10 detection
-        if '10' in text or '1O' in text or 'L0' in text or '10' == text:
-            return 'T'
-        
-        # Check for clear two-character patterns that indicate 10
-        if len(text) >= 2:
-            # Look for patterns that strongly suggest 10
-            ten_indicators = ['10', '1O', 'L0', 'IO', '1Q', 'LO']
-            for indicator in ten_indicators:
-                if indicator in text:
-                    return 'T'
-        
-        # Direct match first
-        if text in self.rank_patterns:
-            return text
-        
-        # Pattern matching - prioritize longer patterns first
-        # Sort patterns by length (longest first) to avoid conflicts
-        all_patterns = []
-        for rank, patterns in self.rank_patterns.items():
-            for pattern in patterns:
-                all_patterns.append((len(pattern.upper()), rank, pattern.upper()))
-        
-        # Sort by length descending, then by rank
-        all_patterns.sort(key=lambda x: (-x[0], x[1]))
-        
-        # Match patterns
-        for length, rank, pattern in all_patterns:
-            if pattern == text or pattern in text:
-                return rank
-        
-        # Last resort: single character matching for clear cases
-        if len(text) == 1:
-            single_char_matches = {
-                'A': 'A', 'K': 'K', 'Q': 'Q', 'J': 'J',
-                '9': '9', '8': '8', '6': '6', '5': '5',
-                '4': '4', '3': '3', '2': '2'
-            }
-            # Note: We avoid '7' and '1' single char matches to prevent 10 confusion
-            if text in single_char_matches:
-                return single_char_matches[text]
-            
-            # Only match '7' if we're confident it's not part of '10'
-            if text == '7':
-                return '7'
-        
-        return None
+        return _match_rank_text(text.strip().upper())
     
     def _save_debug_image(self, img: np.ndarray, result: CardResult):
         """Save debug image with recognition result"""
         timestamp = int(time.time() * 1000)
         filename = f"debug_ocr_{result.rank}{result.suit}_{timestamp}.png"
-        cv2.imwrite(filename, img)
-        logger.info(f"Saved debug image: {filename}")
+        _queue_debug_image(filename, img)
 
-def integrate_with_bot(poker_bot):
-    """Integrate the enhanced OCR system with the poker bot"""
+def integrate_with_bot(poker_bot, use_processes: bool = False):
+    """
+    Integrate the enhanced OCR system with the poker bot
+    
+    Args:
+        poker_bot: Bot whose analyze_game_state is replaced
+        use_processes: Recognize regions in worker processes instead of threads
+    """
     from table_reference_system import TableReferenceSystem
     
     # Initialize systems
@@ -493,7 +915,7 @@ def integrate_with_bot(poker_bot):
                 return None
             
             # Analyze cards
-            return _analyze_cards(poker_bot, ocr_recognizer, screenshot)
+            return _analyze_cards(poker_bot, ocr_recognizer, screenshot, use_processes)
             
         except Exception as e:
             logger.error(f"Enhanced analysis error: {e}")
@@ -518,15 +940,80 @@ def _ensure_calibration(poker_bot, table_ref, screenshot):
         return regions is not None
     return True
 
-def _analyze_cards(poker_bot, ocr_recognizer, screenshot):
+_ocr_pool = None
+_ocr_process_pool = None
+_worker_recognizer = None
+
+# Guards lazy creation of the shared pools so concurrent first callers get the same one
+_pool_lock = threading.Lock()
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for per-region OCR (Tesseract releases the GIL while recognizing)"""
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _pool_lock:
+            if _ocr_pool is None:
+                _ocr_pool = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix='card-ocr')
+    return _ocr_pool
+
+def _get_ocr_process_pool() -> ProcessPoolExecutor:
+    """Shared worker processes for card recognition, each with its own recognizer"""
+    global _ocr_process_pool
+    if _ocr_process_pool is None:
+        with _pool_lock:
+            if _ocr_process_pool is None:
+                _ocr_process_pool = ProcessPoolExecutor(max_workers=OCR_WORKERS, initializer=_init_ocr_worker)
+    return _ocr_process_pool
+
+def shutdown_ocr_pools(wait: bool = True) -> None:
+    """Shut down the shared OCR worker pools (they are recreated on next use)"""
+    global _ocr_pool, _ocr_process_pool
+    with _pool_lock:
+        pools = (_ocr_pool, _ocr_process_pool)
+        _ocr_pool = _ocr_process_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+atexit.register(shutdown_ocr_pools)
+
+def _init_ocr_worker():
+    """Build one recognizer (and its persistent Tesseract API) per worker process"""
+    global _worker_recognizer
+    _worker_recognizer = EnhancedOCRCardRecognition()
+
+def _recognize_card_bytes(buf: bytes, shape: Tuple[int, ...], dtype: str) -> Optional[str]:
+    """Recognize a card sent to a worker process as raw pixel bytes"""
+    card_img = np.frombuffer(buf, dtype=dtype).reshape(shape)
+    result = _worker_recognizer.recognize_card(card_img, debug=False)
+    
+    if result:
+        return f"{result.rank}{result.suit}"
+    
+    return None
+
+def _analyze_cards(poker_bot, ocr_recognizer, screenshot, use_processes=False):
     """Analyze cards from screenshot using regions"""
     hero_cards = []
     community_cards = []
     height, width = screenshot.shape[:2]
     
-    # Process each region
-    for region_name, region_data in poker_bot.regions.items():
-        card_str = _process_region(region_data, screenshot, ocr_recognizer, width, height)
+    # Process regions in parallel, then collect results in region order
+    boxes = _get_region_boxes(poker_bot, width, height)
+    if use_processes:
+        # Crops travel as raw bytes plus shape rather than pickled arrays
+        pool = _get_ocr_process_pool()
+        futures = []
+        for _, x0, y0, x1, y1 in boxes:
+            card_img = screenshot[y0:y1, x0:x1]
+            futures.append(pool.submit(_recognize_card_bytes, card_img.tobytes(), card_img.shape, card_img.dtype.str))
+        card_strs = [future.result() for future in futures]
+    else:
+        card_strs = _get_ocr_pool().map(
+            lambda box: _process_region(box, screenshot, ocr_recognizer),
+            boxes
+        )
+    for (region_name, *_), card_str in zip(boxes, card_strs):
         if card_str:
             if 'hero' in region_name:
                 hero_cards.append(card_str)
@@ -541,20 +1028,37 @@ def _analyze_cards(poker_bot, ocr_recognizer, screenshot):
         'auto_calibrated': True
     }
 
-def _process_region(region_data, screenshot, ocr_recognizer, width, height):
-    """Process a single region and return recognized card string"""
-    x = int(region_data['x_percent'] * width)
-    y = int(region_data['y_percent'] * height)
-    w = int(region_data['width_percent'] * width)
-    h = int(region_data['height_percent'] * height)
+def _get_region_boxes(poker_bot, width, height):
+    """
+    Get (name, x0, y0, x1, y1) pixel boxes for the bot's in-bounds regions.
+    Memoized on the bot until its regions or the frame size change.
+    """
+    cached = getattr(poker_bot, '_region_boxes', None)
+    if cached is not None and cached[0] is poker_bot.regions and cached[1] == (width, height):
+        return cached[2]
     
-    # Extract region if valid
-    if 0 <= x < width and 0 <= y < height and x+w <= width and y+h <= height:
-        card_img = screenshot[y:y+h, x:x+w]
-        result = ocr_recognizer.recognize_card(card_img, debug=True)
+    boxes = []
+    for region_name, region_data in poker_bot.regions.items():
+        x = int(region_data['x_percent'] * width)
+        y = int(region_data['y_percent'] * height)
+        w = int(region_data['width_percent'] * width)
+        h = int(region_data['height_percent'] * height)
         
-        if result:
-            return f"{result.rank}{result.suit}"
+        # Keep region if valid
+        if 0 <= x < width and 0 <= y < height and x+w <= width and y+h <= height:
+            boxes.append((region_name, x, y, x+w, y+h))
+    
+    poker_bot._region_boxes = (poker_bot.regions, (width, height), boxes)
+    return boxes
+
+def _process_region(box, screenshot, ocr_recognizer):
+    """Process a single region box and return recognized card string"""
+    _, x0, y0, x1, y1 = box
+    card_img = screenshot[y0:y1, x0:x1]
+    result = ocr_recognizer.recognize_card(card_img, debug=False)
+    
+    if result:
+        return f"{result.rank}{result.suit}"
     
     return None
 
@@ -7,6 +7,48 @@ Fixes the coordinate format mismatch that prevents proper region usage
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+REGION_COORD_KEYS = ('x', 'y', 'width', 'height')
+
+# Recognition modules live in src/ at the repository root
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+try:
+    from region_loader import RegionLoader
+    REGION_LOADER_AVAILABLE = True
+except ImportError:
+    REGION_LOADER_AVAILABLE = False
+
+def _load_json(path):
+    """Read a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _dump_json(path, data, pretty=True):
+    """Write a JSON file, 2-space indented or compact, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(data))
+    else:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
 
 def fix_region_coordinate_format():
     """Fix the coordinate format in region files"""
@@ -28,8 +70,7 @@ def fix_region_coordinate_format():
         
         try:
             # Read current file
-            with open(region_file, 'r') as f:
-                data = json.load(f)
+            data = _load_json(region_file)
             
             if 'regions' not in data:
                 print(f"   ❌ No regions found in {region_file}")
@@ -43,8 +84,13 @@ def fix_region_coordinate_format():
                 print(f"   ✅ Already in x_percent format")
                 continue
             elif 'x' in sample_region:
-                x_val = sample_region['x']
-                if x_val > 1.0:
+                # Classify every region at once; percentage regions have x > 1.0
+                coords = np.array(
+                    [[region_info[key] for key in REGION_COORD_KEYS] for region_info in data['regions'].values()],
+                    dtype=np.float64
+                ).reshape(-1, len(REGION_COORD_KEYS))
+                needs_scale = coords[:, 0] > 1.0
+                if needs_scale.any():
                     print(f"   🔄 Converting from percentage (0-100) to decimal (0-1) format")
                     format_type = "percentage"
                 else:
@@ -58,25 +104,20 @@ def fix_region_coordinate_format():
             if format_type == "percentage":
                 # Backup original
                 backup_file = region_file + ".backup"
-                with open(backup_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                _dump_json(backup_file, data, pretty=False)
                 print(f"   💾 Backup saved: {backup_file}")
                 
-                # Convert coordinates
-                for region_name, region_info in data['regions'].items():
-                    # Convert from percentage (0-100) to decimal (0-1)
-                    data['regions'][region_name] = {
-                        'x': region_info['x'] / 100.0,
-                        'y': region_info['y'] / 100.0,
-                        'width': region_info['width'] / 100.0,
-                        'height': region_info['height'] / 100.0
-                    }
-                    
-                    print(f"     {region_name}: ({region_info['x']:.1f}%, {region_info['y']:.1f}%) → ({region_info['x']/100:.4f}, {region_info['y']/100:.4f})")
+                # Convert percentage (0-100) regions to decimal (0-1) in one array operation;
+                # regions already in decimal form (mixed files) pass through unchanged
+                coords[needs_scale] /= 100.0
+                data['regions'] = {
+                    region_name: dict(zip(REGION_COORD_KEYS, row))
+                    for region_name, row in zip(data['regions'], coords.tolist())
+                }
+                print(f"   🔄 Converted {int(needs_scale.sum())} of {len(data['regions'])} regions to decimal format")
                 
                 # Save fixed file
-                with open(region_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                _dump_json(region_file, data)
                 
                 print(f"   ✅ Fixed coordinate format in {region_file}")
         
@@ -88,10 +129,11 @@ def validate_region_usage():
     print("\n🧪 Validating Region Usage in Recognition Systems...")
     
     # Test RegionLoader
+    if not REGION_LOADER_AVAILABLE:
+        print(f"   ❌ RegionLoader validation failed: region_loader not importable from {SRC_DIR}")
+        return False
+    
     try:
-        sys.path.append('src')
-        from region_loader import RegionLoader
-        
         loader = RegionLoader()
         regions = loader.load_regions()
         
@@ -134,20 +176,22 @@ def test_coordinate_extraction():
     
     try:
         import cv2
-        import numpy as np
+        from PIL import Image
         
-        # Load test image
-        img = cv2.imread(test_image)
-        if img is None:
+        # Read the test image size from its header; pixels are decoded only if a crop is saved
+        try:
+            with Image.open(test_image) as header:
+                width, height = header.size
+        except Exception:
             print(f"   ❌ Could not load test image")
             return False
         
-        height, width = img.shape[:2]
         print(f"   📐 Test image: {width}x{height}")
         
         # Load regions
-        sys.path.append('src')
-        from region_loader import RegionLoader
+        if not REGION_LOADER_AVAILABLE:
+            print(f"   ❌ region_loader not importable from {SRC_DIR}")
+            return False
         
         loader = RegionLoader()
         regions = loader.load_regions()
@@ -159,32 +203,62 @@ def test_coordinate_extraction():
         # Test extraction for each region
         print(f"\n🎯 Testing Region Extraction:")
         
-        for region_name, region_data in regions.items():
-            # Calculate pixel coordinates
-            x = int(region_data['x'] * width)
-            y = int(region_data['y'] * height)
-            w = int(region_data['width'] * width)
-            h = int(region_data['height'] * height)
-            
-            print(f"   {region_name}:")
-            print(f"     Decimal: x={region_data['x']:.4f}, y={region_data['y']:.4f}")
-            print(f"     Pixels: x={x}, y={y}, w={w}, h={h}")
+        # Calculate pixel coordinates and check them for all regions at once
+        coords = np.array(
+            [(r['x'], r['y'], r['width'], r['height']) for r in regions.values()], dtype=np.float64
+        ).reshape(-1, 4)
+        rects = (coords * (width, height, width, height)).astype(np.int32)
+        xs, ys, ws, hs = rects.T
+        in_bounds = (xs >= 0) & (ys >= 0) & (xs + ws <= width) & (ys + hs <= height)
+        large_enough = (ws >= 10) & (hs >= 10)
+        
+        # Decode the image only when at least one region will be cropped from it
+        img = None
+        if (in_bounds & large_enough).any():
+            img = cv2.imread(test_image)
+            if img is None:
+                print(f"   ❌ Could not load test image")
+                return False
+        
+        # PNG encoding releases the GIL, so debug crops are written in parallel
+        saves = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for (region_name, region_data), (x, y, w, h), inside, large in zip(
+                    regions.items(), rects.tolist(), in_bounds.tolist(), large_enough.tolist()):
+                print(f"   {region_name}:")
+                print(f"     Decimal: x={region_data['x']:.4f}, y={region_data['y']:.4f}")
+                print(f"     Pixels: x={x}, y={y}, w={w}, h={h}")
+                
+                # Check if coordinates are reasonable
+                if not inside:
+                    print(f"     ❌ COORDINATES OUT OF BOUNDS!")
+                elif not large:
+                    print(f"     ❌ REGION TOO SMALL!")
+                else:
+                    print(f"     ✅ Coordinates look valid")
+                    
+                    # Extract and save region for visual verification
+                    region_img = img[y:y+h, x:x+w]
+                    debug_filename = f"debug_region_extraction_{region_name}.png"
+                    saves[debug_filename] = executor.submit(cv2.imwrite, debug_filename, region_img)
+        
+        # Report saves once the writes have finished
+        all_saved = True
+        for debug_filename, future in saves.items():
+            try:
+                saved = bool(future.result())
+                error = "" if saved else " (cv2.imwrite returned False)"
+            except Exception as e:
+                saved = False
+                error = f": {e}"
             
-            # Check if coordinates are reasonable
-            if x < 0 or y < 0 or x + w > width or y + h > height:
-                print(f"     ❌ COORDINATES OUT OF BOUNDS!")
-            elif w < 10 or h < 10:
-                print(f"     ❌ REGION TOO SMALL!")
+            if saved:
+                print(f"   💾 Saved: {debug_filename}")
             else:
-                print(f"     ✅ Coordinates look valid")
-                
-                # Extract and save region for visual verification
-                region_img = img[y:y+h, x:x+w]
-                debug_filename = f"debug_region_extraction_{region_name}.png"
-                cv2.imwrite(debug_filename, region_img)
-                print(f"     💾 Saved: {debug_filename}")
+                print(f"   ❌ Failed to save {debug_filename}{error}")
+                all_saved = False
         
-        return True
+        return all_saved
         
     except Exception as e:
         print(f"   ❌ Coordinate extraction test failed: {e}")
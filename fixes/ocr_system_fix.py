@@ -9,6 +9,36 @@ import sys
 import cv2
 import numpy as np
 import logging
+from collections import Counter
+from functools import lru_cache
+
+# Recognition modules live in src/ at the repository root
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+try:
+    from card_recognizer import CardRecognizer
+    from community_card_detector import CommunityCardDetector
+    RECOGNIZERS_AVAILABLE = True
+except ImportError:
+    RECOGNIZERS_AVAILABLE = False
+
+def _naming_pattern(filename):
+    """Classify a template filename's naming convention"""
+    if '_' in filename:
+        if len(filename.replace('.png', '').split('_')) == 2:
+            return "rank_suit"
+        return "unknown_underscore"
+    return "no_underscore"
+
+def _format_region_x(regions):
+    """Format each region's x_percent as one printable block (regions without one show 'missing')"""
+    xs = np.array([region.get('x_percent', np.nan) for region in regions.values()], dtype=np.float64)
+    return '\n'.join(
+        f"   {name}: x={'missing' if np.isnan(x) else f'{x:.4f}'}"
+        for name, x in zip(regions, xs.tolist())
+    )
 
 def analyze_template_system():
     """Analyze the template matching system"""
@@ -22,23 +52,12 @@ def analyze_template_system():
             return False
         
         # Count templates
-        template_files = [f for f in os.listdir(template_dir) if f.endswith('.png')]
+        with os.scandir(template_dir) as entries:
+            template_files = {entry.name for entry in entries if entry.name.endswith('.png') and entry.is_file()}
         print(f"📁 Found {len(template_files)} template files")
         
         # Analyze naming conventions
-        naming_patterns = {}
-        for filename in template_files:
-            if '_' in filename:
-                parts = filename.replace('.png', '').split('_')
-                if len(parts) == 2:
-                    rank, suit = parts
-                    pattern = "rank_suit"
-                else:
-                    pattern = "unknown_underscore"
-            else:
-                pattern = "no_underscore"
-            
-            naming_patterns[pattern] = naming_patterns.get(pattern, 0) + 1
+        naming_patterns = Counter(_naming_pattern(filename) for filename in template_files)
         
         print(f"📊 Naming patterns:")
         for pattern, count in naming_patterns.items():
@@ -48,12 +67,8 @@ def analyze_template_system():
         expected_ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
         expected_suits = ['hearts', 'diamonds', 'clubs', 'spades']
         
-        missing_cards = []
-        for rank in expected_ranks:
-            for suit in expected_suits:
-                expected_file = f"{rank}_{suit}.png"
-                if expected_file not in template_files:
-                    missing_cards.append(expected_file)
+        expected_files = [f"{rank}_{suit}.png" for rank in expected_ranks for suit in expected_suits]
+        missing_cards = [expected_file for expected_file in expected_files if expected_file not in template_files]
         
         if missing_cards:
             print(f"❌ Missing {len(missing_cards)} template files:")
@@ -70,6 +85,14 @@ def analyze_template_system():
         print(f"❌ Template analysis failed: {e}")
         return False
 
+@lru_cache(maxsize=1)
+def _synthetic_test_card():
+    """Synthetic card image for the OCR smoke test (built once; treat as read-only)"""
+    img = np.full((100, 70, 3), 255, dtype=np.uint8)
+    cv2.putText(img, 'A', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+    cv2.putText(img, '♠', (20, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+    return img
+
 def test_ocr_configuration():
     """Test OCR configuration and functionality"""
     print("\n🔧 Testing OCR Configuration...")
@@ -97,13 +120,8 @@ def test_ocr_configuration():
             ocr_system = EnhancedOCRCardRecognition()
             print("✅ Enhanced OCR system initialized")
             
-            # Create test card image
-            test_img = np.ones((100, 70, 3), dtype=np.uint8) * 255
-            cv2.putText(test_img, 'A', (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
-            cv2.putText(test_img, '♠', (20, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
-            
             # Test recognition
-            result = ocr_system.recognize_card(test_img, debug=False)
+            result = ocr_system.recognize_card(_synthetic_test_card(), debug=False)
             if result:
                 print(f"✅ OCR test successful: {result.rank}{result.suit} (conf: {result.confidence:.2f})")
             else:
@@ -123,32 +141,30 @@ def analyze_recognition_pipeline():
     """Analyze the complete recognition pipeline"""
     print("\n🔄 Analyzing Recognition Pipeline...")
     
+    if not RECOGNIZERS_AVAILABLE:
+        print(f"❌ Recognition pipeline analysis failed: recognizers not importable from {SRC_DIR}")
+        return False
+    
     try:
         # Test CardRecognizer initialization
-        sys.path.append('src')
-        from card_recognizer import CardRecognizer
-        
         recognizer = CardRecognizer()
         print("✅ CardRecognizer initialized")
         
         # Check if regions are loaded
         if hasattr(recognizer, 'card_regions') and recognizer.card_regions:
             print(f"✅ CardRecognizer has {len(recognizer.card_regions)} regions loaded")
-            for name, region in recognizer.card_regions.items():
-                print(f"   {name}: x={region.get('x_percent', 'missing'):.4f}")
+            print(_format_region_x(recognizer.card_regions))
         else:
             print("❌ CardRecognizer has no regions loaded")
         
         # Test CommunityCardDetector
-        from community_card_detector import CommunityCardDetector
-        
         community_detector = CommunityCardDetector(recognizer)
         print("✅ CommunityCardDetector initialized")
         
         if hasattr(community_detector, 'community_card_regions') and community_detector.community_card_regions:
             print(f"✅ CommunityCardDetector has {len(community_detector.community_card_regions)} regions loaded")
-            for name, region in list(community_detector.community_card_regions.items())[:3]:
-                print(f"   {name}: x={region.get('x_percent', 'missing'):.4f}")
+            first_regions = dict(list(community_detector.community_card_regions.items())[:3])
+            print(_format_region_x(first_regions))
         else:
             print("❌ CommunityCardDetector has no regions loaded")
         
@@ -5,8 +5,33 @@ Fix RegionLoader to properly handle user-created regions
 
 import os
 import json
+import time
 import logging
-from typing import Dict, Optional, Any
+import numpy as np
+from pathlib import Path
+from typing import Dict, Optional, Any, Tuple, List
+
+# Seconds before a region file found missing is looked for again
+MISSING_RECHECK_INTERVAL = 5.0
+
+# Map user region names to the names the recognizers expect
+HERO_REGION_MAP = {
+    'hero_card_1': 'hero_card1',
+    'hero_card_2': 'hero_card2'
+}
+COMMUNITY_REGION_MAP = {f'community_card_{i}': f'card_{i}' for i in range(1, 6)}
+
+def _map_regions(regions: Dict[str, Dict], mapping: Dict[str, str]) -> Dict[str, Dict]:
+    """Rename mapped regions and convert them to x_percent/y_percent/width_percent/height_percent format"""
+    return {
+        system_key: {
+            'x_percent': regions[user_key]['x'],
+            'y_percent': regions[user_key]['y'],
+            'width_percent': regions[user_key]['width'],
+            'height_percent': regions[user_key]['height']
+        }
+        for user_key, system_key in mapping.items() if user_key in regions
+    }
 
 class FixedRegionLoader:
     """Fixed region loader that properly handles coordinate formats"""
@@ -24,119 +49,150 @@ class FixedRegionLoader:
         
         if config_file:
             self.region_files.insert(0, config_file)
+        
+        # Converted regions per file, keyed by path:
+        # (st_mtime_ns, regions, hero regions, community regions)
+        self._cache: Dict[str, Tuple[int, Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]] = {}
+        
+        # Last get_pixel_rects result: (regions, width, height, names, rects)
+        self._pixel_rects = None
+        
+        # Missing region files and when to look for them again (time.monotonic())
+        self._missing: Dict[str, float] = {}
     
     def load_regions(self) -> Dict[str, Dict]:
         """Load regions with proper coordinate format handling"""
-        
-        for region_file in self.region_files:
-            if not os.path.exists(region_file):
-                continue
-                
-            try:
-                with open(region_file, 'r') as f:
-                    saved_data = json.load(f)
-                
-                # Handle nested 'regions' key
-                if 'regions' in saved_data:
-                    saved_regions = saved_data['regions']
-                else:
-                    saved_regions = saved_data
-                
-                if not saved_regions:
+        entry = self._load_entry()
+        return entry[1] if entry else {}
+    
+    def _load_entry(self) -> Optional[Tuple[int, Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]]:
+        """Cache entry of the first region file with usable regions"""
+        for region_file, mtime_ns in self._existing_region_files():
+            # Reparse only when the file changed since it was last read
+            cached = self._cache.get(region_file)
+            if cached is None or cached[0] != mtime_ns:
+                try:
+                    regions = self._read_region_file(region_file)
+                except Exception as e:
+                    self.logger.warning(f"Could not load {region_file}: {e}")
                     continue
                 
-                # Convert coordinates to proper decimal format
-                converted_regions = {}
-                
-                for region_name, region_data in saved_regions.items():
-                    if not isinstance(region_data, dict):
-                        continue
-                    
-                    # Handle different coordinate formats
-                    if 'x_percent' in region_data:
-                        # Already in x_percent format
-                        x_val = region_data['x_percent']
-                        y_val = region_data['y_percent']
-                        w_val = region_data['width_percent']
-                        h_val = region_data['height_percent']
-                    elif 'x' in region_data:
-                        # Check if it's percentage (0-100) or decimal (0-1)
-                        x_val = region_data['x']
-                        y_val = region_data['y']
-                        w_val = region_data['width']
-                        h_val = region_data['height']
-                        
-                        # If values are > 1, they're percentages that need conversion
-                        if x_val > 1.0:
-                            x_val = x_val / 100.0
-                            y_val = y_val / 100.0
-                            w_val = w_val / 100.0
-                            h_val = h_val / 100.0
-                    else:
-                        continue
-                    
-                    # Store in standardized format (decimal 0.0-1.0)
-                    converted_regions[region_name] = {
-                        'x': x_val,
-                        'y': y_val,
-                        'width': w_val,
-                        'height': h_val
-                    }
+                cached = (mtime_ns, regions,
+                          _map_regions(regions, HERO_REGION_MAP),
+                          _map_regions(regions, COMMUNITY_REGION_MAP))
                 
-                if converted_regions:
-                    self.logger.info(f"✅ Loaded {len(converted_regions)} regions from {region_file}")
-                    return converted_regions
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not load {region_file}: {e}")
-                continue
+                self._cache[region_file] = cached
+                if cached[1]:
+                    self.logger.info(f"✅ Loaded {len(cached[1])} regions from {region_file}")
+            
+            if cached[1]:
+                return cached
         
         self.logger.error("❌ No valid region files found!")
-        return {}
+        return None
     
-    def get_hero_card_regions(self) -> Dict[str, Dict]:
-        """Get hero card regions in CardRecognizer format"""
-        regions = self.load_regions()
-        hero_regions = {}
+    def _existing_region_files(self):
+        """
+        Yield (path, st_mtime_ns) for region files that exist, in priority order.
+        Lazy, so files after the one the caller settles on are never stat'ed; files found
+        missing are skipped until MISSING_RECHECK_INTERVAL has passed.
+        """
+        now = time.monotonic()
+        for region_file in self.region_files:
+            if self._missing.get(region_file, 0.0) > now:
+                continue
+            try:
+                st = Path(region_file).stat()
+            except OSError:
+                self._missing[region_file] = now + MISSING_RECHECK_INTERVAL
+                continue
+            yield region_file, st.st_mtime_ns
+    
+    def _read_region_file(self, region_file: str) -> Dict[str, Dict]:
+        """Read a region file into decimal (0.0-1.0) x/y/width/height regions"""
+        names, coords = self._parse_region_file(region_file)
         
-        # Map user format to system format
-        mapping = {
-            'hero_card_1': 'hero_card1',
-            'hero_card_2': 'hero_card2'
+        # Store in standardized format (decimal 0.0-1.0)
+        return {
+            region_name: {'x': x_val, 'y': y_val, 'width': w_val, 'height': h_val}
+            for region_name, (x_val, y_val, w_val, h_val) in zip(names, coords.tolist())
         }
+    
+    @staticmethod
+    def _parse_region_file(region_file: str) -> Tuple[List[str], np.ndarray]:
+        """Parse a region file into region names and an (N, 4) decimal x/y/width/height array"""
+        with open(region_file, 'r') as f:
+            saved_data = json.load(f)
         
-        for user_key, system_key in mapping.items():
-            if user_key in regions:
-                region = regions[user_key]
-                hero_regions[system_key] = {
-                    'x_percent': region['x'],
-                    'y_percent': region['y'],
-                    'width_percent': region['width'],
-                    'height_percent': region['height']
-                }
+        # Handle nested 'regions' key
+        if 'regions' in saved_data:
+            saved_regions = saved_data['regions']
+        else:
+            saved_regions = saved_data
         
-        return hero_regions
+        # Collect coordinates, then convert them to proper decimal format in one pass
+        names = []
+        rows = []
+        percent_keys = []
+        
+        for region_name, region_data in (saved_regions or {}).items():
+            if not isinstance(region_data, dict):
+                continue
+            
+            # Handle different coordinate formats
+            if 'x_percent' in region_data:
+                # Already in x_percent format
+                rows.append((region_data['x_percent'], region_data['y_percent'],
+                             region_data['width_percent'], region_data['height_percent']))
+                percent_keys.append(True)
+            elif 'x' in region_data:
+                # Percentage (0-100) or decimal (0-1), decided below
+                rows.append((region_data['x'], region_data['y'], region_data['width'], region_data['height']))
+                percent_keys.append(False)
+            else:
+                continue
+            names.append(region_name)
+        
+        if not rows:
+            return [], np.empty((0, 4), dtype=np.float64)
+        
+        # x/y/width/height regions with x > 1 are percentages that need conversion
+        coords = np.array(rows, dtype=np.float64)
+        needs_scale = ~np.array(percent_keys) & (coords[:, 0] > 1.0)
+        if needs_scale.any():
+            coords[needs_scale] /= 100.0
+        
+        return names, coords
     
-    def get_community_card_regions(self) -> Dict[str, Dict]:
-        """Get community card regions in CommunityCardDetector format"""
+    def get_pixel_rects(self, width: int, height: int) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Get region names and their (N, 4) int32 x/y/w/h pixel rectangles for a frame size.
+        Memoized until the region file or the frame size changes.
+        """
         regions = self.load_regions()
-        community_regions = {}
+        cached = self._pixel_rects
+        if cached is not None and cached[0] is regions and cached[1:3] == (width, height):
+            return cached[3], cached[4]
         
-        # Map user format to system format
-        for i in range(1, 6):
-            user_key = f'community_card_{i}'
-            system_key = f'card_{i}'
-            
-            if user_key in regions:
-                region = regions[user_key]
-                community_regions[system_key] = {
-                    'x_percent': region['x'],
-                    'y_percent': region['y'],
-                    'width_percent': region['width'],
-                    'height_percent': region['height']
-                }
-        
-        return community_regions
+        coords = np.array(
+            [(r['x'], r['y'], r['width'], r['height']) for r in regions.values()], dtype=np.float64
+        ).reshape(-1, 4)
+        rects = (coords * (width, height, width, height)).astype(np.int32)
+        rects.setflags(write=False)
+        names = tuple(regions)
+        
+        self._pixel_rects = (regions, width, height, names, rects)
+        return names, rects
+    
+    def get_hero_card_regions(self) -> Dict[str, Dict]:
+        """Get hero card regions in CardRecognizer format"""
+        entry = self._load_entry()
+        return entry[2] if entry else {}
+    
+    def get_community_card_regions(self) -> Dict[str, Dict]:
+        """Get community card regions in CommunityCardDetector format"""
+        entry = self._load_entry()
+        return entry[3] if entry else {}
 
 def test_fixed_loader():
     """Test the fixed region loader"""
@@ -167,8 +223,20 @@ def test_fixed_loader():
         print(f"❌ Fixed loader test failed: {e}")
         return False
 
+# Visualization frame reused across create_visual_validation calls
+_vis_buffer = None
+
+def _region_color(region_name):
+    """BGR drawing color for a region type"""
+    if 'hero' in region_name:
+        return (0, 255, 255)  # Yellow for hero cards
+    if 'community' in region_name:
+        return (0, 255, 0)    # Green for community cards
+    return (255, 0, 0)        # Blue for others
+
 def create_visual_validation():
     """Create visual validation of region positions"""
+    global _vis_buffer
     print("\n🖼️ Creating Visual Validation...")
     
     test_image = "poker_table_for_regions_20250805_023128.png"
@@ -184,32 +252,29 @@ def create_visual_validation():
         img = cv2.imread(test_image)
         height, width = img.shape[:2]
         
-        # Load regions using fixed loader
+        # Load regions and their pixel coordinates using fixed loader
         loader = FixedRegionLoader()
-        regions = loader.load_regions()
+        names, rects = loader.get_pixel_rects(width, height)
         
-        # Create visualization
-        vis_img = img.copy()
+        # Create visualization in the reused frame buffer
+        if _vis_buffer is None or _vis_buffer.shape != img.shape or _vis_buffer.dtype != img.dtype:
+            _vis_buffer = np.empty_like(img)
+        vis_img = _vis_buffer
+        np.copyto(vis_img, img)
         
-        for region_name, region_data in regions.items():
-            # Calculate pixel coordinates using FIXED method
-            x = int(region_data['x'] * width)
-            y = int(region_data['y'] * height)
-            w = int(region_data['width'] * width)
-            h = int(region_data['height'] * height)
-            
-            # Choose color based on region type
-            if 'hero' in region_name:
-                color = (0, 255, 255)  # Yellow for hero cards
-            elif 'community' in region_name:
-                color = (0, 255, 0)    # Green for community cards
-            else:
-                color = (255, 0, 0)    # Blue for others
-            
-            # Draw rectangle
-            cv2.rectangle(vis_img, (x, y), (x + w, y + h), color, 3)
-            
-            # Add label
+        # Choose color based on region type
+        colors = [_region_color(region_name) for region_name in names]
+        
+        # Draw rectangles as closed polylines, one call per color
+        x0, y0 = rects[:, 0], rects[:, 1]
+        x1, y1 = x0 + rects[:, 2], y0 + rects[:, 3]
+        corners = np.stack([x0, y0, x1, y0, x1, y1, x0, y1], axis=1).reshape(-1, 4, 1, 2)
+        for color in set(colors):
+            group = [corners[i] for i, region_color in enumerate(colors) if region_color == color]
+            cv2.polylines(vis_img, group, True, color, 3)
+        
+        # Add labels
+        for region_name, (x, y, _, _), color in zip(names, rects.tolist(), colors):
             label = region_name.replace('_', ' ').title()
             cv2.putText(vis_img, label, (x, y - 10), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
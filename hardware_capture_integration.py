@@ -5,24 +5,55 @@ Integrates laptop PokerStars capture with main PC bot analysis
 
 import cv2
 import numpy as np
+import os
+import json
 import time
 import logging
+import queue
+import threading
+from collections import deque
 from typing import Optional, Dict, Any, Tuple, List
 import pygetwindow as gw
 import pyautogui
 from dataclasses import dataclass
 
-# Import your existing systems
 try:
-    from enhanced_ocr_recognition import EnhancedOCRCardRecognition
-    from table_reference_system import TableReferenceSystem
-    from enhanced_integration import EnhancedPokerBot
-    from fallback_card_recognition import FallbackCardRecognition
-    from enhanced_card_recognition import EnhancedCardRecognition
-    ENHANCED_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Some recognition modules not available: {e}")
-    ENHANCED_AVAILABLE = False
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import your existing systems
+# Recognition subsystems (OCR, pattern matching) are imported lazily in
+# HardwareCaptureSystem.__init__ so only the configured ones pay their import cost
+from table_reference_system import TableReferenceSystem
+
+# Seconds to wait for the capture thread to deliver a frame
+FRAME_WAIT_TIMEOUT = 1.0
+
+# A grab() faster than this returned a frame the driver had already queued (a stale one);
+# at most MAX_DRAIN_GRABS grabs are spent skipping such frames before decoding
+GRAB_QUEUED_THRESHOLD = 0.002
+MAX_DRAIN_GRABS = 5
+
+# A card region is unchanged when no pixel of its 32x32 thumbnail moved by more than this
+# (sensor noise stays around 10 after area averaging; a rank or suit change moves pixels by 200+)
+CARD_THUMB_TOLERANCE = 24
+
+# Marks a region whose enhanced OCR result was not computed in a batch
+_NOT_BATCHED = object()
+
+def _is_card_region(region_name: str) -> bool:
+    """Whether a region holds a hero or community card"""
+    return 'hero_card' in region_name or 'community_card' in region_name or 'card_' in region_name
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
 
 @dataclass
 class HardwareCaptureConfig:
@@ -59,17 +90,20 @@ class HardwareCaptureSystem:
         
         # Initialize enhanced card recognition system (secondary)
         self.enhanced_recognition = None
-        if ENHANCED_AVAILABLE:
-            try:
-                self.enhanced_recognition = EnhancedCardRecognition(debug_mode=self.config.debug_mode)
-                self.logger.info("Enhanced card recognition system initialized")
-            except Exception as e:
-                self.logger.warning(f"Enhanced card recognition failed to initialize: {e}")
+        try:
+            from enhanced_card_recognition import EnhancedCardRecognition
+            self.enhanced_recognition = EnhancedCardRecognition(debug_mode=self.config.debug_mode)
+            self.logger.info("Enhanced card recognition system initialized")
+        except ImportError as e:
+            self.logger.warning(f"Enhanced card recognition not available: {e}")
+        except Exception as e:
+            self.logger.warning(f"Enhanced card recognition failed to initialize: {e}")
         
         # Initialize OCR systems based on config (legacy fallback)
         self.ocr_systems = {}
         if self.config.recognition_method in ["enhanced", "both"]:
             try:
+                from enhanced_ocr_recognition import EnhancedOCRCardRecognition
                 self.ocr_systems["enhanced"] = EnhancedOCRCardRecognition()
                 self.logger.info("Enhanced OCR system initialized")
             except Exception as e:
@@ -77,6 +111,7 @@ class HardwareCaptureSystem:
         
         if self.config.recognition_method in ["fallback", "both"] or not self.ocr_systems:
             try:
+                from fallback_card_recognition import FallbackCardRecognition
                 self.ocr_systems["fallback"] = FallbackCardRecognition()
                 self.logger.info("Fallback recognition system initialized")
             except Exception as e:
@@ -84,24 +119,36 @@ class HardwareCaptureSystem:
         
         # State tracking
         self.calibrated_regions = None
+        # Pixel slices per calibrated region, built once when regions are loaded
+        self._region_names = None
+        self._region_slices = None
         self.last_analysis_time = 0
-        self.analysis_history = []
+        self.analysis_history = deque(maxlen=10)
         self._last_game_state = None  # Store for UI access
+        self._last_card_thumbs: Optional[List[np.ndarray]] = None
         
         # Live logging for UI
         self.ui_log_callback = None
-        self.detailed_recognition_log = []
+        self.detailed_recognition_log = deque(maxlen=50)
+        # UI log is only built in debug mode; timestamp is formatted once per frame
+        self._log_enabled = self.config.debug_mode
+        self._log_ts = None
         self.recognition_performance_stats = {
             'total_frames': 0,
             'successful_frames': 0,
-            'processing_times': [],
-            'confidence_scores': []
+            'processing_times': deque(maxlen=100),
+            'confidence_scores': deque(maxlen=100)
         }
         
         # Virtual camera capture
         self.virtual_camera = None
         self.camera_index = None
         
+        # Background capture thread keeps only the freshest frame (older ones are dropped)
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._capture_thread = None
+        self._capture_stop = threading.Event()
+        
     def find_obs_virtual_camera(self) -> Optional[int]:
         """Find OBS Virtual Camera index"""
         try:
@@ -148,8 +195,7 @@ class HardwareCaptureSystem:
     def connect_to_virtual_camera(self) -> bool:
         """Connect to OBS Virtual Camera"""
         try:
-            if self.virtual_camera is not None:
-                self.virtual_camera.release()
+            self.stop_capture()
             
             # Find virtual camera
             self.camera_index = self.find_obs_virtual_camera()
@@ -167,11 +213,14 @@ class HardwareCaptureSystem:
             self.virtual_camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
             self.virtual_camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
             self.virtual_camera.set(cv2.CAP_PROP_FPS, 30)
+            # Keep DirectShow from queueing stale frames
+            self.virtual_camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
             # Test capture
             ret, frame = self.virtual_camera.read()
             if ret and frame is not None:
                 self.logger.info(f"✅ Connected to OBS Virtual Camera: {frame.shape}")
+                self._start_capture_thread()
                 return True
             else:
                 self.logger.error("Virtual camera connected but no frame received")
@@ -181,6 +230,71 @@ class HardwareCaptureSystem:
             self.logger.error(f"Error connecting to virtual camera: {e}")
             return False
     
+    def _start_capture_thread(self) -> None:
+        """Start reading frames from the virtual camera in the background"""
+        self._capture_stop = threading.Event()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(self.virtual_camera, self._frame_queue, self._capture_stop),
+            name="virtual-camera-capture",
+            daemon=True
+        )
+        self._capture_thread.start()
+    
+    @staticmethod
+    def _capture_loop(camera, frame_queue: queue.Queue, stop: threading.Event) -> None:
+        """Read frames until stopped, keeping only the newest one in the queue"""
+        while not stop.is_set():
+            # Grab without decoding; while grabs return instantly they are draining queued frames,
+            # and the first grab that blocks has waited for a fresh one
+            grabs = 1
+            start = time.perf_counter()
+            ret = camera.grab()
+            while ret and grabs < MAX_DRAIN_GRABS and time.perf_counter() - start < GRAB_QUEUED_THRESHOLD:
+                grabs += 1
+                start = time.perf_counter()
+                ret = camera.grab()
+            
+            ret, frame = camera.retrieve() if ret else (False, None)
+            if not ret or frame is None:
+                # Let the consumer time out and reconnect
+                break
+            
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            frame_queue.put_nowait(frame)
+    
+    def stop_capture(self) -> None:
+        """Stop the capture thread and release the virtual camera"""
+        self._capture_stop.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join()
+            self._capture_thread = None
+        
+        # Drop any frame from the old connection
+        try:
+            self._frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if self.virtual_camera is not None:
+            self.virtual_camera.release()
+    
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Wait for the capture thread's next frame"""
+        if self._capture_thread is None or not self._capture_thread.is_alive():
+            try:
+                return self._frame_queue.get_nowait()
+            except queue.Empty:
+                return None
+        
+        try:
+            return self._frame_queue.get(timeout=FRAME_WAIT_TIMEOUT)
+        except queue.Empty:
+            return None
+    
     def capture_from_virtual_camera(self) -> Optional[np.ndarray]:
         """Capture frame from OBS Virtual Camera"""
         try:
@@ -189,15 +303,15 @@ class HardwareCaptureSystem:
                 if not self.connect_to_virtual_camera():
                     return None
             
-            # Capture frame
-            ret, frame = self.virtual_camera.read()
+            # Freshest frame from the capture thread
+            frame = self._next_frame()
             
-            if not ret or frame is None:
+            if frame is None:
                 self.logger.warning("Failed to capture frame from virtual camera")
                 # Try to reconnect
                 if self.connect_to_virtual_camera():
-                    ret, frame = self.virtual_camera.read()
-                    if not ret or frame is None:
+                    frame = self._next_frame()
+                    if frame is None:
                         return None
                 else:
                     return None
@@ -224,65 +338,57 @@ class HardwareCaptureSystem:
                 "src/region_config.json"
             ]
             
+            # Get current frame once to determine dimensions
+            screenshot = self.capture_from_virtual_camera()
+            if screenshot is None:
+                self.logger.error("Failed to capture from virtual camera for calibration")
+                return False
+            
+            height, width = screenshot.shape[:2]
+            self.logger.info(f"Current frame dimensions: {width}x{height}")
+            
             for region_file in region_files:
+                if not os.path.exists(region_file):
+                    continue
+                
                 try:
-                    import json
-                    with open(region_file, 'r') as f:
-                        region_data = json.load(f)
+                    region_data = _load_json(region_file)
                     
                     if 'regions' in region_data:
                         # Handle different coordinate formats
-                        self.calibrated_regions = {}
+                        names = list(region_data['regions'])
+                        infos = list(region_data['regions'].values())
                         
-                        # Get current frame to determine dimensions
-                        screenshot = self.capture_from_virtual_camera()
-                        if screenshot is None:
-                            continue
+                        # Fractions (x_percent etc.) scale by the frame size directly
+                        is_fraction = np.array(['x_percent' in r for r in infos], dtype=bool)
+                        raw = np.array([
+                            [r['x_percent'], r['y_percent'], r['width_percent'], r['height_percent']]
+                            if 'x_percent' in r else [r['x'], r['y'], r['width'], r['height']]
+                            for r in infos
+                        ], dtype=np.float64).reshape(-1, 4)
                         
-                        height, width = screenshot.shape[:2]
-                        self.logger.info(f"Current frame dimensions: {width}x{height}")
+                        # Small pixel values (< 100) are likely percentages
+                        is_percent = ~is_fraction & (raw[:, 0] < 100) & (raw[:, 1] < 100)
+                        dims = np.array([width, height, width, height], dtype=np.float64)
+                        px = np.where(is_fraction[:, None], raw * dims,
+                                      np.where(is_percent[:, None], (raw / 100.0) * dims, raw)).astype(np.int64)
                         
-                        for region_name, region_info in region_data['regions'].items():
-                            # Check if coordinates are already in pixels or percentages
-                            if 'x_percent' in region_info:
-                                # Already percentage format
-                                x_pixel = int(region_info['x_percent'] * width)
-                                y_pixel = int(region_info['y_percent'] * height)
-                                w_pixel = int(region_info['width_percent'] * width)
-                                h_pixel = int(region_info['height_percent'] * height)
-                            else:
-                                # Pixel format - check if we need to convert from percentages
-                                x_val = region_info['x']
-                                y_val = region_info['y']
-                                w_val = region_info['width']
-                                h_val = region_info['height']
-                                
-                                # If values are small (< 100), they're likely percentages
-                                if x_val < 100 and y_val < 100:
-                                    # Convert from percentage to pixels
-                                    x_pixel = int((x_val / 100.0) * width)
-                                    y_pixel = int((y_val / 100.0) * height)
-                                    w_pixel = int((w_val / 100.0) * width)
-                                    h_pixel = int((h_val / 100.0) * height)
-                                else:
-                                    # Already in pixels, use directly
-                                    x_pixel = int(x_val)
-                                    y_pixel = int(y_val)
-                                    w_pixel = int(w_val)
-                                    h_pixel = int(h_val)
-                            
-                            # Ensure coordinates are within bounds
-                            x_pixel = max(0, min(x_pixel, width - 1))
-                            y_pixel = max(0, min(y_pixel, height - 1))
-                            w_pixel = max(1, min(w_pixel, width - x_pixel))
-                            h_pixel = max(1, min(h_pixel, height - y_pixel))
-                            
-                            self.calibrated_regions[region_name] = {
-                                'x': x_pixel,
-                                'y': y_pixel,
-                                'width': w_pixel,
-                                'height': h_pixel
-                            }
+                        # Ensure coordinates are within bounds
+                        xs = np.clip(px[:, 0], 0, width - 1)
+                        ys = np.clip(px[:, 1], 0, height - 1)
+                        ws = np.maximum(np.minimum(px[:, 2], width - xs), 1)
+                        hs = np.maximum(np.minimum(px[:, 3], height - ys), 1)
+                        
+                        self.calibrated_regions = {
+                            name: {'x': x, 'y': y, 'width': w, 'height': h}
+                            for name, x, y, w, h in zip(names, xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist())
+                        }
+                        
+                        self._region_names = list(self.calibrated_regions)
+                        self._region_slices = [
+                            (slice(r['y'], r['y'] + r['height']), slice(r['x'], r['x'] + r['width']))
+                            for r in self.calibrated_regions.values()
+                        ]
                         
                         self.logger.info(f"✅ Loaded {len(self.calibrated_regions)} regions from {region_file}")
                         for region_name, region_data in self.calibrated_regions.items():
@@ -296,14 +402,10 @@ class HardwareCaptureSystem:
             # If no existing regions found, try auto-calibration
             self.logger.info("No existing regions found, starting auto-calibration...")
             
-            # Capture current frame from virtual camera
-            screenshot = self.capture_from_virtual_camera()
-            if screenshot is None:
-                self.logger.error("Failed to capture from virtual camera for calibration")
-                return False
-            
             # Use table reference system for auto-calibration
             self.calibrated_regions = self.table_ref.auto_calibrate_from_screenshot(screenshot)
+            self._region_names = None
+            self._region_slices = None
             
             if self.calibrated_regions:
                 self.logger.info(f"Auto-calibration successful! Found {len(self.calibrated_regions)} regions")
@@ -318,7 +420,7 @@ class HardwareCaptureSystem:
             self.logger.error(f"Calibration error: {e}")
             return False
     
-    def recognize_card_from_region(self, image: np.ndarray, region_name: str) -> Optional[Dict]:
+    def recognize_card_from_region(self, image: np.ndarray, region_name: str, ocr_result=_NOT_BATCHED) -> Optional[Dict]:
         """Recognize a card from a specific region using enhanced card recognition"""
         # Try enhanced recognition system first (best option)
         if self.enhanced_recognition:
@@ -344,7 +446,10 @@ class HardwareCaptureSystem:
         for system_name, ocr_system in self.ocr_systems.items():
             try:
                 if system_name == "enhanced":
-                    result = ocr_system.recognize_card(image, debug=self.config.debug_mode)
+                    if ocr_result is _NOT_BATCHED:
+                        result = ocr_system.recognize_card(image, debug=self.config.debug_mode)
+                    else:
+                        result = ocr_result
                 elif system_name == "fallback":
                     result = ocr_system.recognize_card(image, four_color_deck=True)
                 
@@ -379,17 +484,20 @@ class HardwareCaptureSystem:
         if screenshot is None:
             return None
         
+        # Skip recognition when no card region has visibly changed
+        card_thumbs = self._card_region_thumbnails(screenshot)
+        if self._last_game_state is not None and self._thumbnails_unchanged(self._last_card_thumbs, card_thumbs):
+            self.last_analysis_time = current_time
+            return self._last_game_state
+        
         # Perform analysis with detailed logging
         game_state = self._analyze_screenshot_with_logging(screenshot, current_time)
         
-        # Store result for UI access
+        # Store result for UI access; thumbnails only describe a frame whose state was stored
         if game_state:
             self._last_game_state = game_state
-            if not hasattr(self, 'analysis_history'):
-                self.analysis_history = []
+            self._last_card_thumbs = card_thumbs
             self.analysis_history.append(game_state)
-            if len(self.analysis_history) > 10:
-                self.analysis_history.pop(0)
         
         # Update timing
         self.last_analysis_time = current_time
@@ -397,53 +505,62 @@ class HardwareCaptureSystem:
     
     def _analyze_screenshot_with_logging(self, screenshot: np.ndarray, current_time: float) -> Dict:
         """Analyze screenshot with comprehensive logging for UI display"""
-        analysis_start_time = time.time()
-        
-        # Clear previous detailed log
-        self.detailed_recognition_log = []
-        
-        # Add analysis start log
-        self._add_ui_log(f"🎯 Starting frame analysis at {time.strftime('%H:%M:%S')}")
-        self._add_ui_log(f"📐 Frame dimensions: {screenshot.shape[1]}x{screenshot.shape[0]}")
-        self._add_ui_log(f"📍 Processing {len(self.calibrated_regions) if self.calibrated_regions else 0} regions")
-        
-        game_state = {
-            'timestamp': current_time,
-            'hero_cards': [],
-            'community_cards': [],
-            'pot_amount': None,
-            'stack_sizes': {},
-            'analysis_confidence': 0.0,
-            'detailed_results': [],  # For UI display
-            'processing_time': 0.0,
-            'recognition_method': 'Unknown'
-        }
-        
-        # Use Ultimate Recognition System if available
-        if self.ultimate_recognition and self.calibrated_regions:
-            self._add_ui_log("🎯 Using Ultimate Card Recognition System")
-            game_state = self._analyze_with_ultimate_recognition(screenshot, game_state, current_time)
-        else:
-            # Fallback to legacy recognition
-            self._add_ui_log("🔄 Using legacy recognition system")
-            game_state = self._analyze_with_legacy_recognition(screenshot, game_state, current_time)
-        
-        # Calculate total processing time
-        total_time = time.time() - analysis_start_time
-        game_state['processing_time'] = total_time
-        
-        # Update performance stats
-        self._update_performance_stats(game_state, total_time)
-        
-        # Add final summary logs
-        hero_count = len(game_state.get('hero_cards', []))
-        community_count = len(game_state.get('community_cards', []))
-        confidence = game_state.get('analysis_confidence', 0)
-        
-        self._add_ui_log(f"✅ Analysis complete: {hero_count} hero cards, {community_count} community cards")
-        self._add_ui_log(f"📊 Overall confidence: {confidence:.3f}, Processing time: {total_time*1000:.1f}ms")
-        
-        return game_state
+        try:
+            analysis_start_time = time.time()
+            
+            # Clear previous detailed log
+            self.detailed_recognition_log.clear()
+            
+            # Add analysis start log
+            if self._log_enabled:
+                self._log_ts = time.strftime("%H:%M:%S")
+                self._add_ui_log(f"🎯 Starting frame analysis at {self._log_ts}")
+                self._add_ui_log(f"📐 Frame dimensions: {screenshot.shape[1]}x{screenshot.shape[0]}")
+                self._add_ui_log(f"📍 Processing {len(self.calibrated_regions) if self.calibrated_regions else 0} regions")
+            
+            game_state = {
+                'timestamp': current_time,
+                'hero_cards': [],
+                'community_cards': [],
+                'pot_amount': None,
+                'stack_sizes': {},
+                'analysis_confidence': 0.0,
+                'detailed_results': [],  # For UI display
+                'processing_time': 0.0,
+                'recognition_method': 'Unknown'
+            }
+            
+            # Use Ultimate Recognition System if available
+            if self.ultimate_recognition and self.calibrated_regions:
+                if self._log_enabled:
+                    self._add_ui_log("🎯 Using Ultimate Card Recognition System")
+                game_state = self._analyze_with_ultimate_recognition(screenshot, game_state, current_time)
+            else:
+                # Fallback to legacy recognition
+                if self._log_enabled:
+                    self._add_ui_log("🔄 Using legacy recognition system")
+                game_state = self._analyze_with_legacy_recognition(screenshot, game_state, current_time)
+            
+            # Calculate total processing time
+            total_time = time.time() - analysis_start_time
+            game_state['processing_time'] = total_time
+            
+            # Update performance stats
+            self._update_performance_stats(game_state, total_time)
+            
+            # Add final summary logs
+            hero_count = len(game_state.get('hero_cards', []))
+            community_count = len(game_state.get('community_cards', []))
+            confidence = game_state.get('analysis_confidence', 0)
+            
+            if self._log_enabled:
+                self._add_ui_log(f"✅ Analysis complete: {hero_count} hero cards, {community_count} community cards")
+                self._add_ui_log(f"📊 Overall confidence: {confidence:.3f}, Processing time: {total_time*1000:.1f}ms")
+            
+            return game_state
+        finally:
+            # Later log lines must not reuse this frame's timestamp, even if analysis failed
+            self._log_ts = None
     
     def _analyze_with_ultimate_recognition(self, screenshot: np.ndarray, game_state: Dict, current_time: float) -> Dict:
         """Analyze using Ultimate Card Recognition System with detailed logging"""
@@ -458,16 +575,28 @@ class HardwareCaptureSystem:
                 game_state['recognition_method'] = 'Ultimate'
                 
                 # Get detailed log entries from ultimate system
-                detailed_logs = self.ultimate_recognition.get_detailed_log_entries(card_results)
-                for log_entry in detailed_logs:
-                    self._add_ui_log(log_entry)
+                if self._log_enabled:
+                    for log_entry in self.ultimate_recognition.get_detailed_log_entries(card_results):
+                        self._add_ui_log(log_entry)
                 
-                # Convert results to game state format
+                # Convert results to game state format and build the UI details in one pass
                 total_confidence = 0
                 analyzed_cards = 0
+                detailed_results = []
                 
                 for result in card_results:
-                    if not result.is_empty and result.card_code != 'error':
+                    is_error = result.card_code == 'error'
+                    detailed_results.append({
+                        'region': result.region_name,
+                        'card': result.card_code,
+                        'confidence': result.confidence,
+                        'method': result.method,
+                        'time': result.processing_time,
+                        'is_empty': result.is_empty,
+                        'error': result.error_message if is_error else None
+                    })
+                    
+                    if not result.is_empty and not is_error:
                         card_info = {
                             'card': result.card_code,
                             'confidence': result.confidence,
@@ -486,36 +615,29 @@ class HardwareCaptureSystem:
                         analyzed_cards += 1
                         
                         # Log individual card
-                        self._add_ui_log(f"   ✅ {result.region_name}: {result.card_code} (conf: {result.confidence:.3f}, {result.method})")
+                        if self._log_enabled:
+                            self._add_ui_log(f"   ✅ {result.region_name}: {result.card_code} (conf: {result.confidence:.3f}, {result.method})")
                 
                 # Calculate overall confidence
                 if analyzed_cards > 0:
                     game_state['analysis_confidence'] = total_confidence / analyzed_cards
                 
                 # Store detailed results for UI
-                game_state['detailed_results'] = [
-                    {
-                        'region': r.region_name,
-                        'card': r.card_code,
-                        'confidence': r.confidence,
-                        'method': r.method,
-                        'time': r.processing_time,
-                        'is_empty': r.is_empty,
-                        'error': r.error_message if r.card_code == 'error' else None
-                    }
-                    for r in card_results
-                ]
+                game_state['detailed_results'] = detailed_results
                 
                 # Get and log performance stats
-                perf_stats = self.ultimate_recognition.get_performance_stats()
-                self._add_ui_log(f"📈 Ultimate Recognition Stats: {perf_stats}")
+                if self._log_enabled:
+                    perf_stats = self.ultimate_recognition.get_performance_stats()
+                    self._add_ui_log(f"📈 Ultimate Recognition Stats: {perf_stats}")
                 
             else:
-                self._add_ui_log("⚠️ Ultimate Recognition returned no results")
+                if self._log_enabled:
+                    self._add_ui_log("⚠️ Ultimate Recognition returned no results")
                 game_state['recognition_method'] = 'Ultimate-Failed'
                 
         except Exception as e:
-            self._add_ui_log(f"❌ Ultimate Recognition error: {e}")
+            if self._log_enabled:
+                self._add_ui_log(f"❌ Ultimate Recognition error: {e}")
             game_state['recognition_method'] = 'Ultimate-Error'
         
         return game_state
@@ -523,18 +645,32 @@ class HardwareCaptureSystem:
     def _analyze_with_legacy_recognition(self, screenshot: np.ndarray, game_state: Dict, current_time: float) -> Dict:
         """Analyze using legacy recognition systems with detailed logging"""
         if not self.calibrated_regions:
-            self._add_ui_log("❌ No calibrated regions available")
+            if self._log_enabled:
+                self._add_ui_log("❌ No calibrated regions available")
             return game_state
         
         game_state['recognition_method'] = 'Legacy'
         total_confidence = 0
         analyzed_cards = 0
         
-        for region_name, region_data in self.calibrated_regions.items():
+        if self._region_slices is not None:
+            region_imgs = [screenshot[sl] for sl in self._region_slices]
+            batched = self._batch_recognize_cards(self._region_names, region_imgs)
+            regions = zip(self._region_names, region_imgs)
+        else:
+            batched = {}
+            regions = self.calibrated_regions.items()
+        
+        for region_name, region in regions:
             region_start_time = time.time()
-            self._add_ui_log(f"🔍 Analyzing {region_name}...")
+            if self._log_enabled:
+                self._add_ui_log(f"🔍 Analyzing {region_name}...")
             
-            card_data = self._analyze_region(screenshot, region_name, region_data, current_time)
+            if isinstance(region, np.ndarray):
+                card_data = self._analyze_region_image(region, region_name, current_time,
+                                                       batched.get(region_name, _NOT_BATCHED))
+            else:
+                card_data = self._analyze_region(screenshot, region_name, region, current_time)
             region_time = time.time() - region_start_time
             
             if card_data:
@@ -542,8 +678,9 @@ class HardwareCaptureSystem:
                 total_confidence += card_data['confidence']
                 analyzed_cards += 1
                 
-                self._add_ui_log(f"   ✅ {region_name}: {card_data['rank']}{card_data['suit']} (conf: {card_data['confidence']:.3f}, {card_data['method']}, {region_time*1000:.1f}ms)")
-            else:
+                if self._log_enabled:
+                    self._add_ui_log(f"   ✅ {region_name}: {card_data['rank']}{card_data['suit']} (conf: {card_data['confidence']:.3f}, {card_data['method']}, {region_time*1000:.1f}ms)")
+            elif self._log_enabled:
                 self._add_ui_log(f"   ❌ {region_name}: No card detected ({region_time*1000:.1f}ms)")
         
         # Calculate overall confidence
@@ -552,18 +689,39 @@ class HardwareCaptureSystem:
         
         return game_state
     
+    def _batch_recognize_cards(self, region_names: List[str], region_imgs: List[np.ndarray]) -> Dict[str, Any]:
+        """Run the enhanced OCR system once over all card regions, keyed by region name"""
+        ocr_system = self.ocr_systems.get("enhanced")
+        # Only worth it when OCR is the first choice (no enhanced card recognition to try first)
+        if self.enhanced_recognition or not hasattr(ocr_system, 'recognize_cards'):
+            return {}
+        
+        card_names = []
+        card_imgs = []
+        for region_name, region_img in zip(region_names, region_imgs):
+            if _is_card_region(region_name) and region_img.size:
+                card_names.append(region_name)
+                card_imgs.append(region_img)
+        
+        if not card_imgs:
+            return {}
+        
+        try:
+            results = ocr_system.recognize_cards(card_imgs, debug=self.config.debug_mode)
+        except Exception as e:
+            self.logger.warning(f"Batch OCR failed, recognizing regions one by one: {e}")
+            return {}
+        
+        return dict(zip(card_names, results))
+    
     def _add_ui_log(self, message: str):
-        """Add a message to the UI log for real-time display"""
-        timestamp = time.strftime("%H:%M:%S")
+        """Add a message to the UI log for real-time display (callers check _log_enabled first)"""
+        timestamp = self._log_ts or time.strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
         
-        # Store for UI retrieval
+        # Store for UI retrieval (bounded to the last 50 entries)
         self.detailed_recognition_log.append(formatted_message)
         
-        # Keep only last 50 log entries to prevent memory issues
-        if len(self.detailed_recognition_log) > 50:
-            self.detailed_recognition_log = self.detailed_recognition_log[-50:]
-        
         # Call UI callback if available
         if self.ui_log_callback:
             try:
@@ -585,21 +743,17 @@ class HardwareCaptureSystem:
         if hero_cards > 0 or community_cards > 0:
             self.recognition_performance_stats['successful_frames'] += 1
         
-        # Update processing times (keep last 100)
+        # Update processing times (deque keeps last 100)
         self.recognition_performance_stats['processing_times'].append(processing_time)
-        if len(self.recognition_performance_stats['processing_times']) > 100:
-            self.recognition_performance_stats['processing_times'] = self.recognition_performance_stats['processing_times'][-100:]
         
-        # Update confidence scores (keep last 100)
+        # Update confidence scores (deque keeps last 100)
         confidence = game_state.get('analysis_confidence', 0)
         if confidence > 0:
             self.recognition_performance_stats['confidence_scores'].append(confidence)
-            if len(self.recognition_performance_stats['confidence_scores']) > 100:
-                self.recognition_performance_stats['confidence_scores'] = self.recognition_performance_stats['confidence_scores'][-100:]
     
     def get_ui_log_entries(self) -> List[str]:
         """Get current UI log entries for display"""
-        return self.detailed_recognition_log.copy()
+        return list(self.detailed_recognition_log)
     
     def get_performance_summary(self) -> str:
         """Get formatted performance summary for UI display"""
@@ -658,6 +812,27 @@ class HardwareCaptureSystem:
         
         return screenshot
     
+    def _card_region_thumbnails(self, screenshot: np.ndarray) -> Optional[List[np.ndarray]]:
+        """32x32 color thumbnail of each card region (None without region slices)"""
+        if self._region_slices is None:
+            return None
+        
+        return [
+            cv2.resize(screenshot[sl], (32, 32), interpolation=cv2.INTER_AREA)
+            for name, sl in zip(self._region_names, self._region_slices)
+            if _is_card_region(name) and screenshot[sl].size
+        ]
+    
+    @staticmethod
+    def _thumbnails_unchanged(previous: Optional[List[np.ndarray]], current: Optional[List[np.ndarray]]) -> bool:
+        """Whether every card thumbnail is within CARD_THUMB_TOLERANCE of the previous frame's"""
+        if not previous or not current or len(previous) != len(current):
+            return False
+        return all(
+            a.shape == b.shape and cv2.absdiff(a, b).max() <= CARD_THUMB_TOLERANCE
+            for a, b in zip(previous, current)
+        )
+    
     def _analyze_screenshot(self, screenshot: np.ndarray, current_time: float) -> Dict:
         """Analyze screenshot and extract game state"""
         game_state = {
@@ -704,6 +879,16 @@ class HardwareCaptureSystem:
             # Extract region
             region_img = screenshot[y:y+h, x:x+w]
             
+            return self._analyze_region_image(region_img, region_name, current_time)
+            
+        except Exception as e:
+            self.logger.warning(f"Error analyzing region {region_name}: {e}")
+            return None
+    
+    def _analyze_region_image(self, region_img: np.ndarray, region_name: str, current_time: float,
+                              ocr_result=_NOT_BATCHED) -> Optional[Dict]:
+        """Analyze an extracted region image and return card data if found"""
+        try:
             if region_img is None or region_img.size == 0:
                 return None
             
@@ -722,8 +907,8 @@ class HardwareCaptureSystem:
                     self.logger.info(f"Region {region_name} contains potential card content: BGR({avg_color[0]:.0f}, {avg_color[1]:.0f}, {avg_color[2]:.0f})")
             
             # Recognize card if this is a card region
-            if 'hero_card' in region_name or 'community_card' in region_name or 'card_' in region_name:
-                return self.recognize_card_from_region(region_img, region_name)
+            if _is_card_region(region_name):
+                return self.recognize_card_from_region(region_img, region_name, ocr_result)
             
             return None
             
@@ -852,8 +1037,6 @@ class HardwareCaptureSystem:
     def _save_current_state(self, game_state: Dict, advice: Dict) -> None:
         """Save current state for GUI or external access"""
         try:
-            import json
-            
             current_state = {
                 'game_state': game_state,
                 'advice': advice,
@@ -877,10 +1060,10 @@ class HardwareCaptureSystem:
             print("📸 Capturing table screenshot for region creation...")
             print("   Make sure all cards you want to detect are visible!")
             
-            # Capture frame
-            ret, frame = self.virtual_camera.read()
+            # Capture frame (the capture thread owns the camera)
+            frame = self._next_frame()
             
-            if not ret or frame is None:
+            if frame is None:
                 self.logger.error("Failed to capture frame for screenshot")
                 return None
             
@@ -960,8 +1143,7 @@ def test_hardware_capture():
         print("⚠️ Analysis returned no results")
     
     # Cleanup
-    if capture_system.virtual_camera:
-        capture_system.virtual_camera.release()
+    capture_system.stop_capture()
     
     return True
 
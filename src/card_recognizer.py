@@ -86,6 +86,7 @@ class CardRecognizer:
         # Card recognition settings
         self.template_match_threshold = 0.7
         self.ocr_confidence_threshold = 60
+        self.denoise_noise_threshold = 2.0  # Median residual below which NLM denoising is skipped
         
         # Card templates storage
         self.card_templates = {}
@@ -368,8 +369,14 @@ Once templates are collected, restart the bot to load them.
             black_mask = cv2.inRange(hsv, lower_black, upper_black)
             processed['black_mask'] = black_mask
             
-            # Apply denoising for cleaner processing
-            denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+            # Apply denoising for cleaner processing, but only when the image is actually noisy.
+            # Digital screenshots have flat backgrounds, so the median residual against a 3x3
+            # median filter is ~0; capture-card/webcam feeds are the ones that need NLM.
+            noise_level = np.median(cv2.absdiff(gray, cv2.medianBlur(gray, 3)))
+            if noise_level < self.denoise_noise_threshold:
+                denoised = gray
+            else:
+                denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
             processed['denoised'] = denoised
             
             # Enhanced contrast using CLAHE (Contrast Limited Adaptive Histogram Equalization)
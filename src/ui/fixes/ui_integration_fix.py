@@ -190,14 +190,14 @@ class UIIntegrationFix:
                         
                         # Update capture times
                         if stats['processing_times']:
-                            times = stats['processing_times'][-50:]  # Last 50
+                            times = list(stats['processing_times'])[-50:]  # Last 50
                             avg_time = sum(times) / len(times) * 1000  # Convert to ms
                             if hasattr(main_window.performance_monitor, 'update_capture_time'):
                                 main_window.performance_monitor.update_capture_time(avg_time)
                         
                         # Update confidence
                         if stats['confidence_scores']:
-                            confidences = stats['confidence_scores'][-50:]
+                            confidences = list(stats['confidence_scores'])[-50:]
                             avg_conf = sum(confidences) / len(confidences)
                             if hasattr(main_window.performance_monitor, 'update_confidence'):
                                 main_window.performance_monitor.update_confidence(avg_conf)
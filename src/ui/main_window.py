@@ -1599,8 +1599,10 @@ class MainWindow:
         """Disconnect from Hardware Capture System."""
         try:
             if hasattr(self, 'hardware_capture') and self.hardware_capture:
-                # Release virtual camera
-                if hasattr(self.hardware_capture, 'virtual_camera') and self.hardware_capture.virtual_camera:
+                # Stop the capture thread and release virtual camera
+                if hasattr(self.hardware_capture, 'stop_capture'):
+                    self.hardware_capture.stop_capture()
+                elif hasattr(self.hardware_capture, 'virtual_camera') and self.hardware_capture.virtual_camera:
                     self.hardware_capture.virtual_camera.release()
                 self.hardware_capture = None
             
@@ -312,7 +312,14 @@ class PokerStarsWindowCapture:
             self.logger.error(f"Error selecting window: {e}")
             return None
     
-    def capture_window_win32(self, window: Dict) -> Optional[np.ndarray]:
+    @staticmethod
+    def _matching_buffer(dst: Optional[np.ndarray], height: int, width: int) -> Optional[np.ndarray]:
+        """Return dst if it can hold a (height, width) BGR frame, otherwise None."""
+        if dst is not None and dst.shape == (height, width, 3) and dst.dtype == np.uint8:
+            return dst
+        return None
+    
+    def capture_window_win32(self, window: Dict, dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Capture window using win32 API (most reliable for specific windows)."""
         try:
             if not WIN32_AVAILABLE:
@@ -352,7 +359,7 @@ class PokerStarsWindowCapture:
             img.shape = (height, width, 4)  # BGRA format
             
             # Convert BGRA to BGR
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR, dst=self._matching_buffer(dst, height, width))
             
             # Cleanup
             win32gui.DeleteObject(saveBitMap.GetHandle())
@@ -366,7 +373,7 @@ class PokerStarsWindowCapture:
             self.logger.error(f"Error in win32 capture: {e}")
             return None
     
-    def capture_window_mss(self, window: Dict) -> Optional[np.ndarray]:
+    def capture_window_mss(self, window: Dict, dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Capture window using MSS library."""
         try:
             with mss() as sct:
@@ -383,7 +390,8 @@ class PokerStarsWindowCapture:
                 
                 # Convert to numpy array
                 img_array = np.array(screenshot)
-                img_bgr = cv2.cvtColor(img_array, cv2.COLOR_BGRA2BGR)
+                img_bgr = cv2.cvtColor(img_array, cv2.COLOR_BGRA2BGR,
+                                       dst=self._matching_buffer(dst, *img_array.shape[:2]))
                 
                 return img_bgr
                 
@@ -391,7 +399,7 @@ class PokerStarsWindowCapture:
             self.logger.error(f"Error in MSS capture: {e}")
             return None
     
-    def capture_window_pygetwindow(self, window: Dict) -> Optional[np.ndarray]:
+    def capture_window_pygetwindow(self, window: Dict, dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Capture window using pygetwindow."""
         try:
             window_obj = window.get('window_obj')
@@ -416,7 +424,8 @@ class PokerStarsWindowCapture:
                 
                 screenshot = sct.grab(region)
                 img_array = np.array(screenshot)
-                img_bgr = cv2.cvtColor(img_array, cv2.COLOR_BGRA2BGR)
+                img_bgr = cv2.cvtColor(img_array, cv2.COLOR_BGRA2BGR,
+                                       dst=self._matching_buffer(dst, *img_array.shape[:2]))
                 
                 return img_bgr
                 
@@ -424,8 +433,13 @@ class PokerStarsWindowCapture:
             self.logger.error(f"Error in pygetwindow capture: {e}")
             return None
     
-    def capture_current_window(self) -> Optional[np.ndarray]:
-        """Capture the currently selected window using the best available method."""
+    def capture_current_window(self, dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Capture the currently selected window using the best available method.
+        
+        If dst is a uint8 BGR array of the window's size, the frame is written into it
+        and dst is returned; otherwise a new array is allocated.
+        """
         try:
             if not self.selected_window:
                 self.logger.warning("No window selected for capture")
@@ -440,7 +454,7 @@ class PokerStarsWindowCapture:
             
             for method_name, method_func in capture_methods:
                 try:
-                    img = method_func(self.selected_window)
+                    img = method_func(self.selected_window, dst)
                     if img is not None and img.size > 0:
                         self.capture_method = method_name
                         return img
@@ -455,6 +469,10 @@ class PokerStarsWindowCapture:
             self.logger.error(f"Error capturing current window: {e}")
             return None
     
+    def capture_window_into(self, dst: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Capture the selected window, reusing dst as the frame buffer when its size matches."""
+        return self.capture_current_window(dst)
+    
     def validate_capture(self, img: np.ndarray) -> bool:
         """Validate that the captured image looks like a poker table."""
         try:
@@ -0,0 +1,127 @@
+"""Tests for enhanced_ocr_recognition on card crops captured from the client"""
+
+import os
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("pytesseract")
+
+import enhanced_ocr_recognition as ocr
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _load_crop(name):
+    img = cv2.imread(os.path.join(REPO_ROOT, name))
+    assert img is not None, f"missing test crop {name}"
+    # manual_region_calibrator.py saves crops with its 2px green selection box drawn in
+    return img[2:-2, 2:-2]
+
+
+def _corner_suit_region(img):
+    h, w = img.shape[:2]
+    return img[int(h*0.28):int(h*0.58), 0:int(w*0.4)]
+
+
+@pytest.fixture(scope="module")
+def recognizer():
+    return ocr.EnhancedOCRCardRecognition()
+
+
+@pytest.mark.parametrize("crop, suit", [
+    ("manual_region_community_card_1.png", "c"),  # 10 of clubs
+    ("manual_region_community_card_2.png", "s"),  # Queen of spades
+    ("manual_region_community_card_3.png", "h"),  # 8 of hearts
+])
+def test_match_suit_symbol_on_client_crops(recognizer, crop, suit):
+    assert recognizer._match_suit_symbol(_corner_suit_region(_load_crop(crop))) == suit
+
+
+@pytest.mark.parametrize("crop", [
+    "manual_region_community_card_1.png",
+    "manual_region_community_card_2.png",
+    "manual_region_community_card_3.png",
+])
+def test_match_suit_symbol_bottom_right_region_gives_no_suit(recognizer, crop):
+    # The bottom-right pip region (where the 8 of hearts used to match spades) cannot hold a
+    # corner glyph, so it must yield no suit rather than a wrong one
+    img = _load_crop(crop)
+    h, w = img.shape[:2]
+    assert recognizer._match_suit_symbol(img[int(h*0.65):int(h*0.85), int(w*0.65):int(w*0.85)]) is None
+
+
+@pytest.mark.parametrize("crop", [
+    "manual_region_community_card_4.png",
+    "manual_region_community_card_5.png",
+])
+def test_match_suit_symbol_rejects_empty_slots(recognizer, crop):
+    assert recognizer._match_suit_symbol(_corner_suit_region(_load_crop(crop))) is None
+
+
+CARD_CROPS = [
+    "manual_region_community_card_1.png",
+    "manual_region_community_card_2.png",
+    "manual_region_community_card_3.png",
+]
+
+
+def _tesseract_available():
+    if ocr.TESSEROCR_AVAILABLE and ocr._create_tess_api() is not None:
+        return True
+    try:
+        ocr.pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def _tile_offsets(crops):
+    """Left edge of each card's corner tile in the batch OCR composite"""
+    offsets = []
+    x = ocr.BATCH_TILE_GAP
+    for crop in crops:
+        offsets.append(x)
+        x += int(crop.shape[1] * 0.25) + ocr.BATCH_TILE_GAP
+    return offsets
+
+
+def _run_batch(recognizer, monkeypatch, crops, words):
+    monkeypatch.setattr(recognizer, "_ocr_word_boxes", lambda img, psm, whitelist=None: words)
+    grays = [cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) for crop in crops]
+    return recognizer._batch_corner_ocr(crops, grays)
+
+
+def test_batch_corner_ocr_confidence_is_below_single_card_ocr(recognizer, monkeypatch):
+    crops = [_load_crop(name) for name in CARD_CROPS]
+    offsets = _tile_offsets(crops)
+    words = [(rank, 95, offset + 1, 8) for rank, offset in zip(("10", "Q", "8"), offsets)]
+    
+    results = _run_batch(recognizer, monkeypatch, crops, words)
+    
+    assert [(r.rank, r.suit) for r in results[:2]] == [("T", "c"), ("Q", "s")]
+    assert all(r.confidence == ocr.BATCH_OCR_CONFIDENCE < 0.8 for r in results if r)
+
+
+def test_batch_corner_ocr_drops_words_spanning_tiles(recognizer, monkeypatch):
+    crops = [_load_crop(name) for name in CARD_CROPS]
+    offsets = _tile_offsets(crops)
+    # Tesseract merged the first two ranks into one word running across the gap
+    merged = ("10Q", 95, offsets[0] + 1, offsets[1] + 5 - offsets[0])
+    
+    results = _run_batch(recognizer, monkeypatch, crops, [merged])
+    
+    assert results == [None, None, None]
+
+
+@pytest.mark.skipif(not _tesseract_available(), reason="Tesseract is not installed")
+def test_recognize_cards_agrees_with_single_card_recognition():
+    crops = [_load_crop(name) for name in CARD_CROPS]
+    
+    batch = ocr.EnhancedOCRCardRecognition().recognize_cards(crops)
+    single = [ocr.EnhancedOCRCardRecognition().recognize_card(crop) for crop in crops]
+    
+    for batch_result, single_result in zip(batch, single):
+        if batch_result is not None and batch_result.method == 'batch_corner_ocr':
+            assert single_result is not None
+            assert (batch_result.rank, batch_result.suit) == (single_result.rank, single_result.suit)
@@ -0,0 +1,92 @@
+"""Tests for the unchanged-frame gate in HardwareCaptureSystem.analyze_current_frame"""
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("pygetwindow")
+pytest.importorskip("pyautogui")
+
+import hardware_capture_integration as hci
+
+CARD_W, CARD_H = 60, 84
+CARD_XS = (20, 100, 180)
+
+
+def _card_slices(count):
+    return [(slice(20, 20 + CARD_H), slice(x, x + CARD_W)) for x in CARD_XS[:count]]
+
+
+def _table_frame(ranks):
+    """Green table with a white card showing each rank at the CARD_XS positions"""
+    frame = np.zeros((140, 260, 3), dtype=np.uint8)
+    frame[:] = (40, 110, 30)
+    for x, rank in zip(CARD_XS, ranks):
+        cv2.rectangle(frame, (x, 20), (x + CARD_W - 1, 20 + CARD_H - 1), (245, 245, 245), -1)
+        cv2.putText(frame, rank, (x + 8, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 3)
+    return frame
+
+
+def _noisy(frame, seed):
+    """Frame with capture-like sensor noise added"""
+    noise = np.random.default_rng(seed).integers(-6, 7, frame.shape)
+    return np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+@pytest.fixture
+def system():
+    """HardwareCaptureSystem with frames and analysis supplied by the test"""
+    system = hci.HardwareCaptureSystem.__new__(hci.HardwareCaptureSystem)
+    system.config = hci.HardwareCaptureConfig(analysis_interval=0.0)
+    system.last_analysis_time = 0
+    system.analysis_history = []
+    system._last_game_state = None
+    system._last_card_thumbs = None
+    system._region_names = ['community_card_1', 'community_card_2', 'community_card_3']
+    system._region_slices = _card_slices(3)
+
+    system.frames = []
+    system.analyzed = []
+    system._prepare_analysis = lambda: system.frames.pop(0)
+
+    def analyze(screenshot, current_time):
+        system.analyzed.append(screenshot)
+        return {'analysis': len(system.analyzed)}
+
+    system._analyze_screenshot_with_logging = analyze
+    return system
+
+
+def test_unchanged_frame_reuses_stored_state(system):
+    frame = _table_frame(['A', 'K', '7'])
+    system.frames = [_noisy(frame, 0), _noisy(frame, 1)]
+
+    first = system.analyze_current_frame()
+    second = system.analyze_current_frame()
+
+    assert len(system.analyzed) == 1
+    assert second is first
+
+
+def test_single_changed_card_triggers_analysis(system):
+    system.frames = [_table_frame(['A', 'K', '6']), _table_frame(['A', 'K', '8'])]
+
+    system.analyze_current_frame()
+    second = system.analyze_current_frame()
+
+    assert len(system.analyzed) == 2
+    assert second == {'analysis': 2}
+
+
+def test_changed_region_count_resets_gate(system):
+    frame = _table_frame(['A', 'K', '7'])
+    system.frames = [frame, frame.copy()]
+
+    system.analyze_current_frame()
+    # Recalibration dropped a region; the same frame must be analyzed again
+    system._region_names = system._region_names[:2]
+    system._region_slices = _card_slices(2)
+    second = system.analyze_current_frame()
+
+    assert len(system.analyzed) == 2
+    assert second == {'analysis': 2}
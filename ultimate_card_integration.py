@@ -7,6 +7,7 @@ import cv2
 import numpy as np
 import time
 import logging
+from operator import itemgetter
 from typing import Optional, Dict, List, Tuple, Any
 from dataclasses import dataclass
 
@@ -56,6 +57,7 @@ class UltimateCardIntegration:
         # Recognition settings
         self.min_confidence_threshold = 0.1
         self.empty_detection_threshold = 0.05
+        self.short_circuit_confidence = 0.9  # Skip remaining systems once a result is this confident
         
     def _initialize_recognition_systems(self):
         """Initialize all available recognition systems"""
@@ -111,6 +113,9 @@ class UltimateCardIntegration:
         
         self.logger.info(f"🎯 Starting Ultimate Card Recognition on {len(regions)} regions...")
         
+        # Check the log level once per frame so per-card messages are not formatted when filtered
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+        
         # Process each region
         for region_name, region_data in regions.items():
             result = self._recognize_single_card(screenshot, region_name, region_data)
@@ -118,11 +123,12 @@ class UltimateCardIntegration:
             
             # Log individual result
             if result.is_empty:
-                self.logger.debug(f"   {region_name}: EMPTY")
+                self.logger.debug("   %s: EMPTY", region_name)
             elif result.card_code == 'error':
-                self.logger.warning(f"   {region_name}: ERROR - {result.error_message}")
-            else:
-                self.logger.info(f"   {region_name}: {result.card_code} (conf: {result.confidence:.3f}, {result.method}, {result.processing_time*1000:.1f}ms)")
+                self.logger.warning("   %s: ERROR - %s", region_name, result.error_message)
+            elif info_enabled:
+                self.logger.info("   %s: %s (conf: %.3f, %s, %.1fms)", region_name, result.card_code,
+                                 result.confidence, result.method, result.processing_time * 1000)
         
         # Update statistics
         total_time = time.time() - start_time
@@ -257,15 +263,17 @@ class UltimateCardIntegration:
         for system_name, system in self.recognition_systems.items():
             try:
                 result = self._try_recognition_system(system, system_name, region_img)
-                if result and result.get('confidence', 0) >= self.min_confidence_threshold:
+                if result and result['confidence'] >= self.min_confidence_threshold:
+                    # A confident answer makes the slower systems (pattern matching) redundant
+                    if result['confidence'] >= self.short_circuit_confidence:
+                        return result
                     results.append(result)
             except Exception as e:
                 self.logger.warning(f"{system_name} recognition failed for {region_name}: {e}")
         
-        # Return best result based on confidence
+        # Return best result based on confidence (every result dict carries 'confidence')
         if results:
-            best_result = max(results, key=lambda r: r.get('confidence', 0))
-            return best_result
+            return max(results, key=itemgetter('confidence'))
         
         return None
     